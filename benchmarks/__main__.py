@@ -0,0 +1,139 @@
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import PROFILES, CMakeGenerator, generate_corpus
+from cmake_checker.components.fast_lexer import FastLexer
+from cmake_checker.components.file_finder import FileFinder
+from cmake_checker.components.lexer import Lexer
+from cmake_checker.components.reporter import ConsoleReporter, JUnitReporter
+from cmake_checker.components.verifier import Verifier
+
+
+def best_time(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_profile(profile, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        files = generate_corpus(root, profile)
+        contents = [file.read_text() for file in files]
+        results = list(Verifier().check_path(files))
+
+        def analyze(lexer):
+            for content in contents:
+                lexer.analyze(content)
+
+        return {
+            'lexer': best_time(lambda: analyze(Lexer()), repeat),
+            'fast_lexer': best_time(lambda: analyze(FastLexer()), repeat),
+            'file_finder': best_time(lambda: FileFinder().get_all_cmake_files(root), repeat),
+            'verifier': best_time(lambda: list(Verifier().check_path(files)), repeat),
+            'console_reporter': best_time(lambda: ConsoleReporter(results).write_report(io.StringIO()), repeat),
+            'junit_reporter': best_time(lambda: JUnitReporter(results).write_report(io.StringIO()), repeat),
+            'files': len(files),
+            'bytes': sum(len(content) for content in contents),
+            'violations': sum(len(violations) for _, violations in results),
+        }
+
+
+def run_startup(repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        clean_file = Path(directory, 'clean', 'CMakeLists.txt')
+        clean_file.parent.mkdir()
+        clean_file.write_text('cmake_minimum_required(VERSION 3.10)\nproject(clean)\nadd_library(clean clean.cpp)\n')
+        violations_file = Path(directory, 'violations', 'CMakeLists.txt')
+        violations_file.parent.mkdir()
+        violations_file.write_text(CMakeGenerator(seed=0).file_content(10))
+
+        def check(*arguments):
+            command = [sys.executable, '-m', 'cmake_checker', '--warn-only'] + [str(argument) for argument in arguments]
+            subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+
+        return {
+            'interpreter': best_time(lambda: subprocess.run([sys.executable, '-c', 'pass'], check=True), repeat),
+            'clean_file': best_time(lambda: check(clean_file), repeat),
+            'file_with_violations': best_time(lambda: check(violations_file), repeat),
+            'fast_engine': best_time(lambda: check('--engine', 'fast', violations_file), repeat),
+        }
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list:
+    groups = list(results['profiles'].items())
+    expected_groups = dict(baseline.get('profiles', {}))
+    if 'startup' in results:
+        groups.append(('startup', results['startup']))
+        expected_groups['startup'] = baseline.get('startup', {})
+
+    regressions = []
+    for group, timings in groups:
+        for name, seconds in timings.items():
+            expected = expected_groups.get(group, {}).get(name)
+            if isinstance(seconds, float) and expected and seconds > expected * (1 + threshold):
+                regressions.append('%s/%s: %.4fs (baseline %.4fs)' % (group, name, seconds, expected))
+    return regressions
+
+
+def parse_arguments() -> argparse.Namespace:
+    arguments_parser = argparse.ArgumentParser(prog='python -m benchmarks')
+
+    arguments_parser.add_argument('--profile',
+                                  choices=sorted(PROFILES),
+                                  action='append',
+                                  help='Corpus profile to benchmark (default: all)'
+                                  )
+    arguments_parser.add_argument('--repeat',
+                                  type=int,
+                                  default=3,
+                                  help='Number of runs, the best one is reported'
+                                  )
+    arguments_parser.add_argument('-o',
+                                  '--output-file',
+                                  type=argparse.FileType('w'),
+                                  default=sys.stdout,
+                                  help='Write results as JSON to file with given name'
+                                  )
+    arguments_parser.add_argument('--baseline',
+                                  type=argparse.FileType('r'),
+                                  help='JSON results to compare with'
+                                  )
+    arguments_parser.add_argument('--threshold',
+                                  type=float,
+                                  default=0.2,
+                                  help='Allowed slowdown relative to baseline (default: 0.2 = 20%%)'
+                                  )
+    return arguments_parser.parse_args()
+
+
+def main():
+    arguments = parse_arguments()
+
+    results = {
+        'python': platform.python_version(),
+        'profiles': {name: run_profile(PROFILES[name], arguments.repeat) for name in arguments.profile or PROFILES},
+        'startup': run_startup(max(arguments.repeat, 10)),
+    }
+    json.dump(results, arguments.output_file, indent=2, sort_keys=True)
+    arguments.output_file.write('\n')
+
+    if arguments.baseline is not None:
+        regressions = find_regressions(results, json.load(arguments.baseline), arguments.threshold)
+        for regression in regressions:
+            print('Regression: ' + regression, file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+import random
+from pathlib import Path
+
+
+class CorpusProfile(object):
+    def __init__(self, name: str, files: int, blocks_per_file: int, max_depth: int):
+        self.name = name
+        self.files = files
+        self.blocks_per_file = blocks_per_file
+        self.max_depth = max_depth
+
+
+PROFILES = {
+    'many-small': CorpusProfile('many-small', files=1000, blocks_per_file=4, max_depth=6),
+    'few-huge': CorpusProfile('few-huge', files=3, blocks_per_file=600, max_depth=1),
+}
+
+
+class CMakeGenerator(object):
+    VIOLATIONS = [
+        'file(GLOB SOURCES src/*.cpp)',
+        'add_compile_options(-Wall)',
+        'add_definitions(-DLEGACY)',
+        'add_compile_definitions(LEGACY)',
+        'include_directories(${PROJECT_SOURCE_DIR}/include)',
+        '  link_directories(/opt/lib)',
+        'link_libraries(pthread)',
+        'set(CMAKE_CXX_FLAGS "${CMAKE_CXX_FLAGS} -O2")',
+        'endif(WIN32)',
+        'set(ENV{PATH} "/opt/bin")',
+        'set(CACHED_VALUE ON CACHE BOOL "")',
+        'set(RESULT ${VALUE} PARENT_SCOPE)',
+    ]
+
+    def __init__(self, seed: int):
+        self.random = random.Random(seed)
+        self.counter = 0
+
+    def file_content(self, blocks: int) -> str:
+        return ''.join(self.block() for _ in range(blocks))
+
+    def block(self) -> str:
+        generators = [self.target_block, self.bracket_comment, self.set_block, self.function_block,
+                      self.disabled_region, self.violation_block]
+        return self.random.choice(generators)()
+
+    def name(self) -> str:
+        self.counter = self.counter + 1
+        return 'item_%d' % self.counter
+
+    def target_block(self) -> str:
+        target = self.name()
+        sources = ''.join('    src/%s.cpp\n' % self.name() for _ in range(self.random.randint(2, 12)))
+        return ('add_library(%s STATIC)\n'
+                'target_sources(%s\n  PRIVATE\n%s    ${CMAKE_CURRENT_SOURCE_DIR}/../../shared/common.cpp\n)\n'
+                'target_compile_options(%s PRIVATE -Wall)  # add_compile_options( in a comment\n'
+                'target_link_libraries(%s PUBLIC dependency)\n\n' % (target, target, sources, target, target))
+
+    def bracket_comment(self) -> str:
+        depth = '=' * self.random.randint(0, 4)
+        inner = ''.join('  %s ]%s]\n' % (self.random.choice(self.VIOLATIONS), '=' * self.random.randint(0, 3))
+                        for _ in range(self.random.randint(3, 20)))
+        return '#[%s[\n%s]%s]\n' % (depth, inner, depth)
+
+    def set_block(self) -> str:
+        values = ''.join('    value_%d # comment with ENV{ and CACHE\n' % index
+                         for index in range(self.random.randint(10, 60)))
+        return 'set(%s\n%s)\n' % (self.name(), values)
+
+    def function_block(self) -> str:
+        body = ''.join('  if(%s)\n    set(%s ON PARENT_SCOPE)\n  endif()\n' % (self.name(), self.name())
+                       for _ in range(self.random.randint(2, 10)))
+        ending = self.random.choice(['endfunction()', 'endfunction(%s)' % self.name()])
+        return 'function(%s ARGUMENT)\n%s%s\n\n' % (self.name(), body, ending)
+
+    def disabled_region(self) -> str:
+        body = ''.join('%s\n' % self.random.choice(self.VIOLATIONS) for _ in range(self.random.randint(5, 40)))
+        return '# cmake-check disable\n%s# cmake-check enable\n' % body
+
+    def violation_block(self) -> str:
+        return ''.join('%s\n' % self.random.choice(self.VIOLATIONS) for _ in range(self.random.randint(1, 4)))
+
+
+def generate_corpus(directory: Path, profile: CorpusProfile, seed: int = 0) -> list:
+    generator = CMakeGenerator(seed)
+    files = []
+    for index in range(profile.files):
+        depth = generator.random.randint(0, profile.max_depth)
+        folder = directory.joinpath(*['dir_%d' % generator.random.randint(0, 9) for _ in range(depth)])
+        name = 'CMakeLists.txt' if index % 3 else 'module_%d.cmake' % index
+        folder.mkdir(parents=True, exist_ok=True)
+        file = folder / name
+        if file.exists():
+            file = folder / ('module_%d.cmake' % index)
+        file.write_text(generator.file_content(profile.blocks_per_file))
+        files.append(file)
+    return files
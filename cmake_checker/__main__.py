@@ -1,29 +1,226 @@
+import argparse
+import itertools
+import os
 import sys
+from pathlib import Path
+from typing import Iterable, Iterator
 
-from cmake_checker.components.file_finder import provide_files_for_verification
 from cmake_checker.components.parse_arguments import parse_arguments
-from cmake_checker.components.verifier import Verifier
-from cmake_checker.components.reporter import Reporter
 
 
-def compute_exit_code(violations: list, warn_only: bool) -> int:
+def compute_exit_code(violation_count: int, warn_only: bool) -> int:
     if warn_only is True:
         return 0
-    if any(len(v) for f, v in violations):
+    if violation_count:
         return -1
     return 0
 
 
+def limit_violations(files_with_info: Iterator, max_violations: int) -> Iterator:
+    remaining = max_violations
+    for file, violations in files_with_info:
+        if len(violations) < remaining:
+            remaining = remaining - len(violations)
+            yield file, violations
+            continue
+
+        counter = itertools.count()
+        yield file, violations.select(lambda violation_type, line: next(counter) < remaining)
+        files_with_info.close()
+        sys.stderr.write('Stopped after finding %d violation(s).\n' % max_violations)
+        return
+
+
+def create_cache(arguments: argparse.Namespace):
+    if arguments.cache_dir is None:
+        return None
+    from cmake_checker.components.cache import ResultCache
+    return ResultCache(arguments.cache_dir,
+                       max_size=arguments.cache_max_size * 1024 * 1024,
+                       max_age=arguments.cache_max_age * 24 * 60 * 60,
+                       rules=arguments.selected_rules)
+
+
+def provide_files(arguments: argparse.Namespace) -> Iterable:
+    from cmake_checker.components.file_finder import provide_files_for_verification, \
+        provide_changed_files_for_verification
+    if arguments.changed_since is None:
+        return provide_files_for_verification(arguments.PATH, arguments.whitelist)
+
+    from cmake_checker.components.git_changes import list_changed_files, GitChangesError
+    try:
+        changed_files = list_changed_files(arguments.changed_since, arguments.PATH)
+    except GitChangesError as error:
+        sys.exit(str(error))
+    return provide_changed_files_for_verification(arguments.PATH, arguments.whitelist, changed_files)
+
+
+def load_baseline(arguments: argparse.Namespace):
+    if arguments.baseline is None:
+        return None
+    from cmake_checker.components.baseline import Baseline, BaselineError
+    try:
+        return Baseline.load(arguments.baseline)
+    except BaselineError as error:
+        sys.exit(str(error))
+
+
+def create_diff_filter(arguments: argparse.Namespace):
+    if arguments.diff is None:
+        return None
+    from cmake_checker.components.diff_filter import DiffFilter
+    from cmake_checker.components.git_changes import repository_root
+    root = Path(arguments.diff_root) if arguments.diff_root is not None else repository_root()
+    strip = arguments.diff_strip if arguments.diff_strip is not None else 1
+    return DiffFilter.from_unified_diff(arguments.diff, strip, root)
+
+
+def report_unchecked_diff_files(diff_filter) -> None:
+    unchecked_files = diff_filter.unchecked_files()
+    for file in unchecked_files:
+        sys.stderr.write('Warning: %s changed in diff was not checked\n' % file)
+    if any(not os.path.isfile(file) for file in unchecked_files):
+        sys.exit('Files changed in diff do not exist, check --diff-strip and --diff-root')
+
+
+def create_statistics(arguments: argparse.Namespace):
+    if arguments.stats is None:
+        return None
+    from cmake_checker.components.statistics import Statistics
+    return Statistics(arguments.stats_slowest)
+
+
+def run(arguments: argparse.Namespace) -> int:
+    from cmake_checker.components.file_finder import discover_in_background
+    from cmake_checker.components.reporter import Reporter
+    from cmake_checker.components.verifier import Verifier
+    from cmake_checker.components.violations import ViolationCounter
+
+    baseline = load_baseline(arguments)
+    cache = create_cache(arguments)
+    statistics = create_statistics(arguments)
+    filters_violations = arguments.diff is not None or arguments.project_graph or baseline is not None
+    verify = Verifier(arguments.jobs, cache, statistics, arguments.selected_rules, arguments.engine,
+                      None if filters_violations else arguments.max_violations)
+
+    files = provide_files(arguments)
+    if arguments.shard is not None:
+        files = arguments.shard.select_files(files)
+    files = discover_in_background(files)
+    if statistics is not None:
+        files = statistics.timed('discovery', files)
+
+    diff_filter = create_diff_filter(arguments)
+    if diff_filter is None:
+        files_with_info = verify.check_path(files)
+    else:
+        files_with_info = diff_filter.select_violations(verify.check_path(diff_filter.select_files(files)))
+
+    if arguments.project_graph:
+        from cmake_checker.components.project_graph import ProjectGraph
+        files_with_info = ProjectGraph().select_violations(files_with_info)
+
+    new_baseline = None
+    if arguments.write_baseline is not None:
+        from cmake_checker.components.baseline import Baseline
+        new_baseline = Baseline()
+        files_with_info = new_baseline.record(files_with_info)
+    if baseline is not None:
+        files_with_info = baseline.select_new_violations(files_with_info)
+
+    if arguments.max_violations is not None:
+        files_with_info = limit_violations(files_with_info, arguments.max_violations)
+
+    if statistics is not None:
+        files_with_info = statistics.timed('verification', files_with_info)
+
+    counter = ViolationCounter()
+    reporter = Reporter.create(arguments.reporter, counter.counted(files_with_info), arguments.shard)
+    if statistics is None:
+        reporter.write_report(arguments.output_file)
+    else:
+        with statistics.measure('reporting'):
+            reporter.write_report(arguments.output_file)
+
+    if cache is not None:
+        cache.cleanup()
+
+    if new_baseline is not None:
+        new_baseline.write(arguments.write_baseline)
+
+    if statistics is not None:
+        statistics.write_json(arguments.stats)
+
+    if diff_filter is not None and (arguments.max_violations is None or counter.count < arguments.max_violations):
+        report_unchecked_diff_files(diff_filter)
+
+    return compute_exit_code(counter.count, arguments.warn_only)
+
+
+def run_merge(arguments: argparse.Namespace) -> int:
+    from cmake_checker.components.reporter import Reporter
+    from cmake_checker.components.shards import PartialResults, ShardError
+    from cmake_checker.components.violations import ViolationCounter
+
+    try:
+        results = PartialResults.merge(arguments.PARTIAL)
+    except ShardError as error:
+        sys.exit(str(error))
+
+    counter = ViolationCounter()
+    Reporter.create(arguments.reporter, counter.counted(results.files_with_info())).write_report(arguments.output_file)
+    return compute_exit_code(counter.count, arguments.warn_only)
+
+
+def run_on_server(arguments: argparse.Namespace) -> int:
+    from cmake_checker.components.client import DaemonError, request_check
+
+    request = {
+        'cwd': os.getcwd(),
+        'paths': [str(path) for path in arguments.PATH],
+        'whitelist': list(arguments.whitelist) if arguments.whitelist is not None else None,
+        'reporter': arguments.reporter,
+        'project_graph': arguments.project_graph,
+    }
+    try:
+        response = request_check(arguments.server, request)
+    except DaemonError as error:
+        sys.exit(str(error))
+
+    arguments.output_file.write(response['output'])
+    return compute_exit_code(response['violation_count'], arguments.warn_only)
+
+
+def run_server(arguments: argparse.Namespace) -> None:
+    from cmake_checker.components.daemon import DaemonError, serve
+
+    try:
+        serve(arguments.socket, arguments.ROOT, arguments.jobs, arguments.watcher, arguments.poll_interval,
+              arguments.selected_rules, arguments.engine)
+    except (DaemonError, OSError) as error:
+        sys.exit(str(error))
+
+
 def main():
     arguments = parse_arguments()
-    verify = Verifier()
-
-    files = provide_files_for_verification(arguments.PATH, arguments.whitelist)
-    files_with_info = verify.check_path(files)
-    reporter = Reporter.create(arguments.reporter, files_with_info)
-    arguments.output_file.write(reporter.generate_report())
+    if arguments.command == 'serve':
+        run_server(arguments)
+        return
+    if arguments.command == 'merge':
+        sys.exit(run_merge(arguments))
+    if arguments.server is not None:
+        sys.exit(run_on_server(arguments))
+    if arguments.profile is None:
+        sys.exit(run(arguments))
 
-    sys.exit(compute_exit_code(files_with_info, arguments.warn_only))
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        exit_code = profiler.runcall(run, arguments)
+    finally:
+        profiler.dump_stats(arguments.profile)
+    sys.exit(exit_code)
 
 
-main()
+if __name__ == '__main__':
+    main()
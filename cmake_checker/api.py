@@ -0,0 +1,5 @@
+from cmake_checker.components.checker import Checker
+from cmake_checker.components.rules import RULE_NAMES
+from cmake_checker.components.violations import Violation, Violations
+
+__all__ = ['Checker', 'RULE_NAMES', 'Violation', 'Violations']
@@ -0,0 +1,91 @@
+import collections
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO, Tuple
+
+from .violations import Violations
+
+
+class BaselineError(Exception):
+    pass
+
+
+class Baseline(object):
+    VERSION = 1
+
+    def __init__(self):
+        self.fingerprints = collections.Counter()
+        self.entries = {}
+
+    @classmethod
+    def load(cls, stream: TextIO) -> 'Baseline':
+        try:
+            content = json.load(stream)
+            if content.get('version') != cls.VERSION:
+                raise BaselineError('Unsupported baseline version: %s' % content.get('version'))
+            baseline = cls()
+            for entry in content['violations']:
+                baseline.fingerprints[entry['fingerprint']] += entry['count']
+                baseline.entries[entry['fingerprint']] = (entry['file'], entry['rule'])
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            raise BaselineError('Invalid baseline file %s: %s' % (getattr(stream, 'name', ''), error))
+        return baseline
+
+    @staticmethod
+    def fingerprint(file: str, violation_type: str, source_line: str) -> str:
+        normalized_line = ' '.join(source_line.split())
+        return hashlib.sha256('\0'.join((file, violation_type, normalized_line)).encode()).hexdigest()[:32]
+
+    def add(self, file: Path, violations: Violations) -> None:
+        file_key = self.__file_key(file)
+        for violation_type, line in violations:
+            fingerprint = self.fingerprint(file_key, violation_type, violations.source_line(line))
+            self.fingerprints[fingerprint] += 1
+            self.entries[fingerprint] = (file_key, violation_type)
+
+    def record(self, files_with_info: Iterable) -> Iterator[Tuple[Path, Violations]]:
+        for file, violations in files_with_info:
+            self.add(file, violations)
+            yield file, violations
+
+    def select_new_violations(self, files_with_info: Iterable) -> Iterator[Tuple[Path, Violations]]:
+        remaining = self.fingerprints.copy()
+        for file, violations in files_with_info:
+            file_key = self.__file_key(file)
+
+            def is_new(violation_type: str, line: int) -> bool:
+                fingerprint = self.fingerprint(file_key, violation_type, violations.source_line(line))
+                if remaining[fingerprint] > 0:
+                    remaining[fingerprint] -= 1
+                    return False
+                return True
+
+            yield file, violations.select(is_new) if violations else violations
+
+    def write(self, path: Path) -> None:
+        entries = [{'file': file, 'rule': rule, 'fingerprint': fingerprint, 'count': self.fingerprints[fingerprint]}
+                   for fingerprint, (file, rule) in self.entries.items()]
+        entries.sort(key=lambda entry: (entry['file'], entry['rule'], entry['fingerprint']))
+
+        directory = os.path.dirname(os.path.abspath(str(path)))
+        descriptor, temporary_file = tempfile.mkstemp(dir=directory, prefix='.baseline-')
+        try:
+            with os.fdopen(descriptor, 'w') as baseline_file:
+                json.dump({'version': self.VERSION, 'violations': entries}, baseline_file, indent=1)
+                baseline_file.write('\n')
+            os.replace(temporary_file, str(path))
+        except BaseException:
+            os.unlink(temporary_file)
+            raise
+
+    @staticmethod
+    def __file_key(file: Path) -> str:
+        absolute_path = os.path.abspath(str(file))
+        try:
+            relative_path = os.path.relpath(absolute_path)
+        except ValueError:
+            relative_path = absolute_path
+        return os.path.normcase(relative_path).replace(os.sep, '/')
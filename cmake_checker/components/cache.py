@@ -0,0 +1,101 @@
+import contextlib
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable
+
+from cmake_checker import __version__
+from .lexer import Lexer
+
+
+class ResultCache(object):
+    DEFAULT_MAX_SIZE = 100 * 1024 * 1024
+    DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+    TEMPORARY_PREFIX = '.tmp-'
+    NAMESPACE = re.compile(r'[0-9a-f]{16}\Z')
+    PREFIX = re.compile(r'[0-9a-f]{2}\Z')
+    ENTRY = re.compile(r'([0-9a-f]{64}|\.tmp-.*)\Z', re.S)
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_MAX_SIZE, max_age: int = DEFAULT_MAX_AGE,
+                 rules: Iterable[str] = None):
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+        self.namespace = hashlib.sha256((__version__ + Lexer.fingerprint(rules)).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def key(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, key: str):
+        entry = self.__entry_path(key)
+        try:
+            with entry.open() as entry_file:
+                violations = [(violation_type, line) for violation_type, line in json.load(entry_file)]
+            os.utime(str(entry))
+        except (OSError, ValueError):
+            return None
+        return violations
+
+    def put(self, key: str, violations: list) -> None:
+        entry = self.__entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            self.__write_atomically(entry, json.dumps(violations))
+        except OSError:
+            pass
+
+    def cleanup(self) -> None:
+        entries = self.__collect_entries()
+        expiry_time = time.time() - self.max_age
+        total_size = sum(size for _, _, size in entries)
+
+        for modification_time, entry, size in sorted(entries):
+            if modification_time >= expiry_time and total_size <= self.max_size:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+            total_size -= size
+
+    def __entry_path(self, key: str) -> Path:
+        return self.directory / self.namespace / key[:2] / key
+
+    @staticmethod
+    def __write_atomically(entry: Path, content: str) -> None:
+        descriptor, temporary_name = tempfile.mkstemp(dir=str(entry.parent), prefix=ResultCache.TEMPORARY_PREFIX)
+        try:
+            with os.fdopen(descriptor, 'w') as temporary_file:
+                temporary_file.write(content)
+            os.replace(temporary_name, str(entry))
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temporary_name)
+            raise
+
+    def __collect_entries(self) -> list:
+        entries = []
+        for namespace in self.__list(str(self.directory), self.NAMESPACE, directories=True):
+            for prefix in self.__list(namespace.path, self.PREFIX, directories=True):
+                for entry in self.__list(prefix.path, self.ENTRY, directories=False):
+                    if not entry.name.startswith((prefix.name, self.TEMPORARY_PREFIX)):
+                        continue
+                    try:
+                        status = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((status.st_mtime, Path(entry.path), status.st_size))
+        return entries
+
+    @staticmethod
+    def __list(directory: str, pattern, directories: bool) -> list:
+        try:
+            return [entry for entry in os.scandir(directory)
+                    if pattern.match(entry.name) and entry.is_dir(follow_symlinks=False) == directories]
+        except OSError:
+            return []
@@ -0,0 +1,41 @@
+import threading
+from typing import Callable, Iterable, Iterator, Tuple, Union
+
+from .engines import ENGINES
+from .rules import RULE_NAMES, select_rules
+from .verifier import Verifier
+from .violations import Violations
+
+Content = Union[bytes, str]
+
+
+class Checker(object):
+    def __init__(self, rules: Iterable[str] = None, engine: str = 'ply'):
+        if rules is not None:
+            rules = list(rules)
+            unknown = [name for name in rules if name not in RULE_NAMES]
+            if unknown:
+                raise ValueError('Unknown rule(s): %s (available: %s)' % (', '.join(unknown), ', '.join(RULE_NAMES)))
+        if engine not in ENGINES:
+            raise ValueError('Unknown engine: %s (available: %s)' % (engine, ', '.join(ENGINES)))
+        self.rules = select_rules(rules)
+        self.engine = engine
+        self.local = threading.local()
+
+    def check(self, buffers: Iterable, loader: Callable[[str], Content] = None) -> Iterator[Tuple[str, Violations]]:
+        verifier = self.__verifier()
+        for buffer in buffers:
+            if loader is None:
+                name, content = buffer
+            else:
+                name, content = buffer, loader(buffer)
+            yield name, verifier.check_content(content)
+
+    def check_buffer(self, content: Content) -> Violations:
+        return self.__verifier().check_content(content)
+
+    def __verifier(self) -> Verifier:
+        verifier = getattr(self.local, 'verifier', None)
+        if verifier is None:
+            verifier = self.local.verifier = Verifier(rules=self.rules, engine=self.engine)
+        return verifier
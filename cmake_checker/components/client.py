@@ -0,0 +1,29 @@
+import getpass
+import json
+import os
+import socket
+import tempfile
+
+
+class DaemonError(Exception):
+    pass
+
+
+def default_socket_path() -> str:
+    return os.path.join(tempfile.gettempdir(), 'cmake-checker-%s.sock' % getpass.getuser())
+
+
+def request_check(socket_path: str, request: dict) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+            connection.sendall(json.dumps(request).encode() + b'\n')
+            connection.shutdown(socket.SHUT_WR)
+            with connection.makefile('rb') as response_file:
+                response = json.loads(response_file.read().decode())
+        except (OSError, ValueError) as error:
+            raise DaemonError("Couldn't get results from cmake-checker server at %s: %s" % (socket_path, error))
+
+    if 'error' in response:
+        raise DaemonError('cmake-checker server failed: %s' % response['error'])
+    return response
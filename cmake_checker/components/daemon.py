@@ -0,0 +1,155 @@
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple
+
+from .client import DaemonError
+from .file_finder import provide_files_for_verification
+from .project_graph import ProjectGraph
+from .reporter import Reporter
+from .verifier import Verifier
+from .violations import ViolationCounter, Violations
+from .watcher import create_watcher
+
+
+class ResultsIndex(object):
+    def __init__(self, verifier: Verifier):
+        self.verifier = verifier
+        self.results = {}
+        self.lock = threading.Lock()
+
+    def check_path(self, files: Iterable[Path]) -> Iterator[Tuple[Path, Violations]]:
+        files = [(file, os.path.abspath(str(file))) for file in files]
+        states = {key: self.__state(key) for _, key in files}
+        with self.lock:
+            cached = {key: self.results.get(key) for _, key in files}
+
+        missing = [file for file, key in files if cached[key] is None or cached[key][0] != states[key]]
+        checked = {os.path.abspath(str(file)): violations for file, violations in self.verifier.check_path(missing)}
+        with self.lock:
+            for key, violations in checked.items():
+                self.results[key] = (states[key], violations)
+
+        for file, key in files:
+            yield file, checked[key] if key in checked else cached[key][1]
+
+    def invalidate(self, path: str) -> None:
+        prefix = os.path.join(path, '')
+        with self.lock:
+            for key in [key for key in self.results if key == path or key.startswith(prefix)]:
+                del self.results[key]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.results.clear()
+
+    @staticmethod
+    def __state(path: str):
+        try:
+            status = os.stat(path)
+        except OSError:
+            return None
+        return status.st_mtime_ns, status.st_size
+
+
+class CheckServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: str, roots: Iterable[Path], jobs: int = 1, watcher: str = 'auto',
+                 poll_interval: float = 1.0, rules: Iterable[str] = None, engine: str = 'ply'):
+        self.roots = [os.path.abspath(str(root)) for root in roots]
+        self.verifier = Verifier(jobs, rules=rules, engine=engine)
+        self.index = ResultsIndex(self.verifier)
+        self.project_graph = ProjectGraph()
+        self.listings = {}
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.watcher = create_watcher(self.roots, self.on_change, watcher, poll_interval)
+        super(CheckServer, self).__init__(socket_path, _CheckRequestHandler)
+        self.verifier.open_pool()
+
+    def server_activate(self) -> None:
+        os.chmod(self.server_address, 0o600)
+        super(CheckServer, self).server_activate()
+
+    def server_close(self) -> None:
+        self.verifier.close_pool()
+        super(CheckServer, self).server_close()
+
+    def on_change(self, path: str, structural: bool) -> None:
+        if path is None:
+            self.index.clear()
+        else:
+            self.index.invalidate(path)
+        if structural or path is None:
+            with self.lock:
+                self.listings.clear()
+                self.generation = self.generation + 1
+
+    def check(self, request: dict) -> dict:
+        os.chdir(request['cwd'])
+        files = self.__list_files([Path(path) for path in request['paths']], request.get('whitelist'))
+
+        files_with_info = self.index.check_path(files)
+        if request.get('project_graph'):
+            files_with_info = self.project_graph.select_violations(files_with_info)
+
+        counter = ViolationCounter()
+        output = Reporter.create(request.get('reporter', 'console'), counter.counted(files_with_info)).generate_report()
+        return {'output': output, 'violation_count': counter.count}
+
+    def __list_files(self, paths: list, whitelist) -> list:
+        key = (os.getcwd(), tuple(str(path) for path in paths), tuple(whitelist) if whitelist is not None else None)
+        watched = all(self.__is_watched(os.path.abspath(str(path))) for path in paths)
+        with self.lock:
+            generation = self.generation
+            if watched and key in self.listings:
+                return self.listings[key]
+
+        files = list(provide_files_for_verification(paths, whitelist))
+        with self.lock:
+            if watched and generation == self.generation:
+                self.listings[key] = files
+        return files
+
+    def __is_watched(self, path: str) -> bool:
+        return any(path == root or path.startswith(os.path.join(root, '')) for root in self.roots)
+
+
+class _CheckRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            response = self.server.check(json.loads(self.rfile.readline().decode()))
+        except Exception as error:
+            response = {'error': '%s: %s' % (type(error).__name__, error)}
+        self.wfile.write(json.dumps(response).encode() + b'\n')
+
+
+def serve(socket_path: str, roots: Iterable[Path], jobs: int = 1, watcher: str = 'auto',
+          poll_interval: float = 1.0, rules: Iterable[str] = None, engine: str = 'ply') -> None:
+    _remove_stale_socket(socket_path)
+    server = CheckServer(socket_path, roots, jobs, watcher, poll_interval, rules, engine)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    server.watcher.start()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.watcher.stop()
+        server.server_close()
+        os.unlink(socket_path)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except OSError:
+            os.unlink(socket_path)
+            return
+    raise DaemonError('cmake-checker server is already running at %s' % socket_path)
@@ -0,0 +1,78 @@
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple
+
+from .file_finder import FileFinder
+from .violations import Violations
+
+
+class DiffFilter(object):
+    HUNK_HEADER = re.compile(r'^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+    NEW_FILE_HEADER = '+++ '
+    NO_FILE = '/dev/null'
+
+    def __init__(self, changed_lines: dict):
+        self.changed_lines = changed_lines
+        self.selected = set()
+
+    @classmethod
+    def from_unified_diff(cls, diff: Iterable[str], strip: int = 1, root: Path = None) -> 'DiffFilter':
+        changed_lines = {}
+        added_lines = None
+        old_remaining = new_remaining = 0
+        new_line_number = 0
+
+        for line in diff:
+            if old_remaining > 0 or new_remaining > 0:
+                if line.startswith('+'):
+                    added_lines.add(new_line_number)
+                    new_line_number, new_remaining = new_line_number + 1, new_remaining - 1
+                elif line.startswith('-'):
+                    old_remaining = old_remaining - 1
+                elif not line.startswith('\\'):
+                    new_line_number, new_remaining = new_line_number + 1, new_remaining - 1
+                    old_remaining = old_remaining - 1
+                continue
+
+            if line.startswith(cls.NEW_FILE_HEADER):
+                added_lines = cls.__lines_for_file(changed_lines, line[len(cls.NEW_FILE_HEADER):], strip,
+                                                   root)
+                continue
+
+            hunk = cls.HUNK_HEADER.match(line)
+            if hunk is not None and added_lines is not None:
+                old_remaining = int(hunk.group(1) or 1)
+                new_line_number = int(hunk.group(2))
+                new_remaining = int(hunk.group(3) or 1)
+
+        return cls({file: lines for file, lines in changed_lines.items() if lines})
+
+    @classmethod
+    def __lines_for_file(cls, changed_lines: dict, header: str, strip: int, root: Path):
+        name = header.rstrip('\n').split('\t')[0]
+        if name == cls.NO_FILE:
+            return set()
+        name = os.path.join(str(root) if root is not None else '', *name.split('/')[strip:])
+        return changed_lines.setdefault(cls.__key(name), set())
+
+    @staticmethod
+    def __key(file) -> str:
+        return os.path.normcase(os.path.abspath(str(file)))
+
+    def select_files(self, files: Iterable[Path]) -> Iterator[Path]:
+        for file in files:
+            key = self.__key(file)
+            if key in self.changed_lines:
+                self.selected.add(key)
+                yield file
+
+    def unchecked_files(self) -> list:
+        return sorted(file for file in self.changed_lines if file not in self.selected and
+                      (file.endswith(FileFinder.CMAKE_FILE_SUFFIX) or
+                       os.path.basename(file) == os.path.normcase(FileFinder.CMAKE_LISTS_FILE)))
+
+    def select_violations(self, files_with_info: Iterable) -> Iterator[Tuple[Path, Violations]]:
+        for file, violations in files_with_info:
+            changed_lines = self.changed_lines.get(self.__key(file), ())
+            yield file, violations.select(lambda violation_type, line: line in changed_lines)
@@ -0,0 +1,11 @@
+from typing import Iterable
+
+ENGINES = ('fast', 'ply')
+
+
+def create_lexer(engine: str, rules: Iterable[str] = None):
+    if engine == 'fast':
+        from .fast_lexer import FastLexer
+        return FastLexer(rules)
+    from .lexer import Lexer
+    return Lexer(rules)
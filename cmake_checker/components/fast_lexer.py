@@ -0,0 +1,162 @@
+import itertools
+import re
+from collections import namedtuple
+from typing import Iterable, Iterator, Tuple
+
+from .lexer import Lexer
+
+Token = namedtuple('Token', ['type', 'value', 'lineno', 'lexpos'])
+
+
+class FastLexer(object):
+    CATCH_ALL = 'ignore_CHARACTER'
+    NEWLINE = 'newline'
+    ERROR = 'error'
+    NEWLINES = re.compile(r'\n+')
+
+    def __init__(self, rules: Iterable[str] = None):
+        self.rules = frozenset(Lexer.tokens if rules is None else rules)
+        self.actions = {
+            't_begin_bracketcomments': self.__begin_bracket_comments,
+            't_bracketcomments_end': self.__end_bracket_comments,
+            't_begin_declfunc': self.__begin_function,
+            't_declfunc_ENDFUNCTION': self.__end_function_with_name,
+            't_declfunc_end': self.__end_function,
+            't_setfunc_PARENT_SCOPE': self.__parent_scope,
+            't_begin_targetsources': lambda value: self.__push_state('targetsources'),
+            't_targetsources_end': self.__pop_state,
+            't_begin_setfunc': lambda value: self.__push_state('setfunc'),
+            't_setfunc_end': self.__pop_state,
+            't_comments_begin_disabled': lambda value: self.__push_state('disabled'),
+            't_disabled_end': self.__pop_state,
+            't_INITIAL_targetsources_setfunc_begin_comments': lambda value: self.__push_state('comments'),
+            't_comments_end': self.__pop_state,
+        }
+        self.token_types = {}
+        self.newline_states = set()
+        self.patterns = self.__compile_states()
+        self.state = 'INITIAL'
+        self.state_stack = []
+        self.lineno = 1
+        self.is_in_function = False
+        self.bracket_comment_count = 0
+
+    def analyze(self, data: str, limit: int = None) -> list:
+        self.__reset()
+        return list(itertools.islice(self.__tokenize(data, 0), limit))
+
+    def analyze_chunks(self, chunks: Iterable[str]) -> Iterator[Tuple[str, Iterator[Token]]]:
+        self.__reset()
+        start = 0
+        for chunk in chunks:
+            data = '\n' + chunk if start else chunk
+            yield data, self.__tokenize(data, start)
+            start = 1
+
+    def __reset(self) -> None:
+        self.state = 'INITIAL'
+        self.state_stack = []
+        self.lineno = 1
+        self.is_in_function = False
+
+    def __tokenize(self, data: str, start: int) -> Iterator[Token]:
+        position = counted = start
+        lineno = self.lineno
+        while True:
+            match = self.patterns[self.state].search(data, position)
+            if match is None:
+                break
+            begin = match.start()
+            if data[begin] == '\n' and self.state in self.newline_states:
+                position = self.NEWLINES.match(data, begin).end()
+                continue
+
+            position = match.end()
+            name = match.lastgroup
+            token_type = self.token_types.get(name)
+            if name in self.actions and not self.actions[name](match.group()):
+                continue
+            if token_type in self.rules:
+                lineno = lineno + data.count('\n', counted, begin)
+                counted = begin
+                yield Token(token_type, match.group(), lineno, begin)
+        self.lineno = lineno + data.count('\n', counted)
+
+    def __compile_states(self) -> dict:
+        state_names = [name for name, _ in Lexer.states]
+        functions = {state: [] for state in ['INITIAL'] + state_names}
+        strings = {state: [] for state in functions}
+        for name in sorted(attribute for attribute in dir(Lexer) if attribute.startswith('t_')):
+            rule = getattr(Lexer, name)
+            states, token_type = self.__split_rule_name(name, state_names)
+            if token_type in (self.ERROR, self.CATCH_ALL):
+                continue
+            if token_type == self.NEWLINE:
+                self.newline_states.update(states)
+                continue
+            if isinstance(rule, str):
+                if token_type not in self.rules:
+                    name = name[:-len(token_type)] + 'ignore_' + token_type
+                    token_type = None
+                for state in states:
+                    strings[state].append((name, rule))
+            else:
+                if name not in self.actions:
+                    raise NotImplementedError('No action for lexer rule %s' % name)
+                for state in states:
+                    functions[state].append((name, rule.__doc__, rule.__code__.co_firstlineno))
+            self.token_types[name] = token_type
+
+        patterns = {}
+        for state in functions:
+            functions[state].sort(key=lambda rule: rule[2])
+            strings[state].sort(key=lambda rule: len(rule[1]), reverse=True)
+            patterns[state] = [(name, regex) for name, regex, _ in functions[state]] + strings[state]
+        for state, state_type in Lexer.states:
+            if state_type == 'inclusive':
+                patterns[state] = patterns[state] + patterns['INITIAL']
+                if 'INITIAL' in self.newline_states:
+                    self.newline_states.add(state)
+        return {state: re.compile('|'.join('(?P<%s>%s)' % rule for rule in rules), re.VERBOSE)
+                for state, rules in patterns.items()}
+
+    @staticmethod
+    def __split_rule_name(name: str, state_names: list) -> tuple:
+        parts = name.split('_')
+        index = 1
+        while index < len(parts) and (parts[index] in state_names or parts[index] in ('INITIAL', 'ANY')):
+            index = index + 1
+        states = parts[1:index] or ['INITIAL']
+        if 'ANY' in states:
+            states = ['INITIAL'] + state_names
+        return states, '_'.join(parts[index:])
+
+    def __push_state(self, state: str) -> None:
+        self.state_stack.append(self.state)
+        self.state = state
+
+    def __pop_state(self, value: str = None) -> None:
+        self.state = self.state_stack.pop()
+
+    def __begin_bracket_comments(self, value: str) -> None:
+        self.bracket_comment_count = value.count('=')
+        self.__push_state('bracketcomments')
+
+    def __end_bracket_comments(self, value: str) -> None:
+        if self.bracket_comment_count == value.count('='):
+            self.__pop_state()
+
+    def __begin_function(self, value: str) -> None:
+        self.__push_state('declfunc')
+        self.is_in_function = True
+
+    def __end_function_with_name(self, value: str) -> bool:
+        self.__end_function(value)
+        return True
+
+    def __end_function(self, value: str) -> None:
+        self.__pop_state()
+        self.is_in_function = False
+
+    def __parent_scope(self, value: str) -> bool:
+        return not self.is_in_function
@@ -1,30 +1,163 @@
+import os
+import queue
+import threading
 from pathlib import Path
-from pathspec import PathSpec
+from typing import Iterable, Iterator
 
 
-def provide_files_for_verification(paths: list, whitelist_content) -> list:
+DISCOVERY_QUEUE_SIZE = 1024
+
+
+def provide_files_for_verification(paths: list, whitelist_content) -> Iterator[Path]:
+    file_finder = FileFinder(whitelist_content)
+
+    for path in paths:
+        yield from file_finder.iterate_cmake_files(path)
+
+
+def provide_changed_files_for_verification(paths: list, whitelist_content, changed_files: list) -> Iterator[Path]:
     file_finder = FileFinder(whitelist_content)
 
-    file_list = []
     for path in paths:
-        file_list += file_finder.get_all_cmake_files(path)
-    return file_list
+        yield from file_finder.iterate_changed_cmake_files(path, changed_files)
+
+
+def discover_in_background(files: Iterable[Path], queue_size: int = DISCOVERY_QUEUE_SIZE) -> Iterator[Path]:
+    discovery = _BackgroundDiscovery(files, queue_size)
+    try:
+        yield from discovery
+    finally:
+        discovery.stop()
+
+
+class _DiscoveryFailure(object):
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _BackgroundDiscovery(object):
+    END = object()
+    PUT_TIMEOUT = 0.1
+
+    def __init__(self, files: Iterable[Path], queue_size: int):
+        self.files = files
+        self.queue = queue.Queue(queue_size)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.__discover, name='cmake-checker-discovery', daemon=True)
+        self.thread.start()
+
+    def __iter__(self) -> Iterator[Path]:
+        while True:
+            item = self.queue.get()
+            if item is self.END:
+                return
+            if isinstance(item, _DiscoveryFailure):
+                raise item.error
+            yield item
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def __discover(self) -> None:
+        try:
+            for file in self.files:
+                if not self.__put(file):
+                    return
+        except BaseException as error:
+            self.__put(_DiscoveryFailure(error))
+        else:
+            self.__put(self.END)
+
+    def __put(self, item) -> bool:
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=self.PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+        return False
 
 
 class FileFinder(object):
+    CMAKE_FILE_SUFFIX = '.cmake'
+    CMAKE_LISTS_FILE = 'CMakeLists.txt'
+
     def __init__(self, whitelist=None):
-        if whitelist is None:
-            whitelist = []
-        self.ignore_spec = PathSpec.from_lines('gitwildmatch', whitelist)
+        self.whitelist = None
+        if whitelist:
+            from .whitelist import WhitelistMatcher
+            self.whitelist = WhitelistMatcher(whitelist)
 
     def get_all_cmake_files(self, path: Path) -> list:
+        return list(self.iterate_cmake_files(path))
+
+    def iterate_cmake_files(self, path: Path) -> Iterator[Path]:
+        if not path.is_dir():
+            yield path
+            return
+
+        cmake_lists_files = []
+        yield from self.__walk(str(path), cmake_lists_files)
+        yield from cmake_lists_files
+
+    def iterate_changed_cmake_files(self, path: Path, changed_files: list) -> Iterator[Path]:
         if not path.is_dir():
-            return [path]
-        return self.__get_all_files_from_dir(path)
+            if any(self.__real_file_path(file) == self.__real_file_path(path) for file in changed_files):
+                yield path
+            return
 
-    def __get_all_files_from_dir(self, path: Path) -> list:
-        all_cmake_files = sorted(path.glob('**/*.cmake')) + sorted(path.glob('**/CMakeLists.txt'))
-        return [file for file in all_cmake_files if not self.__is_on_whitelist(file)]
+        real_path = Path(os.path.realpath(str(path)))
+        cmake_files = []
+        cmake_lists_files = []
+        for changed_file in changed_files:
+            try:
+                file = path / self.__real_file_path(changed_file).relative_to(real_path)
+            except ValueError:
+                continue
+            if self.__is_on_whitelist(file):
+                continue
+            if file.name.endswith(self.CMAKE_FILE_SUFFIX):
+                cmake_files.append(file)
+            elif file.name == self.CMAKE_LISTS_FILE:
+                cmake_lists_files.append(file)
+
+        yield from sorted(cmake_files)
+        yield from sorted(cmake_lists_files)
+
+    @staticmethod
+    def __real_file_path(file: Path) -> Path:
+        absolute_path = Path(os.path.abspath(str(file)))
+        return Path(os.path.realpath(str(absolute_path.parent)), absolute_path.name)
+
+    def __walk(self, directory: str, cmake_lists_files: list) -> Iterator[Path]:
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: os.path.normcase(entry.name))
+        except PermissionError:
+            return
+
+        for entry in entries:
+            if entry.name.endswith(self.CMAKE_FILE_SUFFIX):
+                file = Path(entry.path)
+                if not self.__is_on_whitelist(file):
+                    yield file
+            elif entry.name == self.CMAKE_LISTS_FILE and os.path.exists(entry.path):
+                file = Path(entry.path)
+                if not self.__is_on_whitelist(file):
+                    cmake_lists_files.append(file)
+
+            if self.__is_directory_to_descend(entry):
+                yield from self.__walk(entry.path, cmake_lists_files)
+
+    def __is_directory_to_descend(self, entry) -> bool:
+        try:
+            if not entry.is_dir() or entry.is_symlink():
+                return False
+        except OSError:
+            return False
+        return not self.__is_directory_on_whitelist(entry.path)
 
     def __is_on_whitelist(self, file: Path) -> bool:
-        return self.ignore_spec.match_file(str(file))
+        return self.whitelist is not None and self.whitelist.match_file(str(file))
+
+    def __is_directory_on_whitelist(self, directory: str) -> bool:
+        return self.whitelist is not None and self.whitelist.match_directory(directory)
@@ -0,0 +1,41 @@
+import os
+import subprocess
+from pathlib import Path
+from typing import Iterable
+
+
+class GitChangesError(Exception):
+    pass
+
+
+def list_changed_files(reference: str, paths: Iterable[Path]) -> list:
+    changed_files = set()
+    for top_level in {_top_level(str(path if path.is_dir() else path.parent)) for path in paths}:
+        changed_names = _run_git(['diff', '--name-only', '-z', '--diff-filter=d', reference, '--'], str(top_level))
+        untracked_names = _run_git(['ls-files', '-z', '--others', '--exclude-standard', '--full-name'], str(top_level))
+        changed_files.update(top_level / name for name in changed_names + untracked_names)
+    return sorted(changed_files)
+
+
+def repository_root(cwd: str = None):
+    try:
+        return _top_level(cwd)
+    except GitChangesError:
+        return None
+
+
+def _top_level(cwd: str) -> Path:
+    top_level = _run_git(['rev-parse', '--show-toplevel'], cwd)
+    if len(top_level) != 1:
+        raise GitChangesError('git rev-parse failed: %s is not in a working tree' % (cwd or os.getcwd()))
+    return Path(top_level[0].rstrip('\n'))
+
+
+def _run_git(arguments: list, cwd: str) -> list:
+    try:
+        result = subprocess.run(['git'] + arguments, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as error:
+        raise GitChangesError("Couldn't run git: %s" % error)
+    if result.returncode != 0:
+        raise GitChangesError("git %s failed: %s" % (arguments[0], result.stderr.decode(errors='replace').strip()))
+    return [os.fsdecode(name) for name in result.stdout.split(b'\0') if name]
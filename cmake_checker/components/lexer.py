@@ -1,3 +1,10 @@
+import hashlib
+import importlib.util
+import itertools
+import os
+import types
+from typing import Iterable, Iterator, Tuple
+
 import ply.lex as lex
 
 
@@ -40,12 +47,91 @@ class Lexer(object):
     t_setfunc_MODIFY_ENV_VARIABLE = r'[ \t]*ENV\{'
     t_setfunc_CACHE_IN_SET = r'[ \t]+CACHE'
     t_targetsources_PARENT_DIR_ACCESS = r'\.\.\/\.\.'
+    t_INITIAL_bracketcomments_targetsources_setfunc_disabled_comments_ignore_CHARACTER = r'.'
+
+    TABLES_MODULE = 'lextab'
+    TABLES_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 
-    def __init__(self):
-        self.lexer = lex.lex(module=self)
+    def __init__(self, rules: Iterable[str] = None):
+        self.rules = frozenset(self.tokens if rules is None else rules)
+        self.lexer = self.__build_lexer()
         self.is_in_function = False
         self.bracket_comment_count = 0
 
+    @classmethod
+    def fingerprint(cls, rules: Iterable[str] = None) -> str:
+        fingerprint = hashlib.sha256(repr((cls.states, cls.tokens)).encode())
+        for name in sorted(attribute for attribute in dir(cls) if attribute.startswith('t_')):
+            rule = getattr(cls, name)
+            fingerprint.update(('%s=%s\n' % (name, rule if isinstance(rule, str) else rule.__doc__)).encode())
+        if rules is not None and set(rules) != set(cls.tokens):
+            fingerprint.update(('rules=%s\n' % ','.join(sorted(rules))).encode())
+        return fingerprint.hexdigest()
+
+    def __build_lexer(self) -> lex.Lexer:
+        if self.rules != frozenset(self.tokens):
+            return lex.lex(module=self.__selected_rules_module())
+
+        fingerprint = self.fingerprint()
+        tables = self.__load_tables(fingerprint)
+        if tables is not None:
+            return lex.lex(module=self, optimize=True, lextab=tables)
+
+        lexer = lex.lex(module=self)
+        self.__write_tables(lexer, fingerprint)
+        return lexer
+
+    def __selected_rules_module(self) -> types.SimpleNamespace:
+        module = types.SimpleNamespace(__file__=__file__, states=self.states)
+        module.tokens = [token for token in self.tokens if token in self.rules or not self.__is_string_rule(token)]
+        for name in dir(self):
+            if not name.startswith('t_'):
+                continue
+            rule = getattr(self, name)
+            token = next((token for token in self.tokens if name.endswith('_' + token)), None)
+            if isinstance(rule, str) and token is not None and token not in self.rules:
+                name = name[:-len(token)] + 'ignore_' + token
+            setattr(module, name, rule)
+        return module
+
+    @classmethod
+    def __is_string_rule(cls, token: str) -> bool:
+        return any(isinstance(getattr(cls, name), str) for name in dir(cls)
+                   if name.startswith('t_') and name.endswith('_' + token))
+
+    def __load_tables(self, fingerprint: str):
+        tables_file = os.path.join(self.TABLES_DIRECTORY, self.TABLES_MODULE + '.py')
+        try:
+            spec = importlib.util.spec_from_file_location(self.TABLES_MODULE, tables_file)
+            tables = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(tables)
+        except (OSError, SyntaxError):
+            return None
+
+        if getattr(tables, '_tabversion', None) != lex.__tabversion__:
+            return None
+        if getattr(tables, '_rules_fingerprint', None) != fingerprint:
+            return None
+        return tables
+
+    def __write_tables(self, lexer: lex.Lexer, fingerprint: str) -> None:
+        import shutil
+        import tempfile
+        try:
+            temporary_directory = tempfile.mkdtemp(dir=self.TABLES_DIRECTORY)
+        except OSError:
+            return
+        try:
+            lexer.writetab(self.TABLES_MODULE, temporary_directory)
+            temporary_file = os.path.join(temporary_directory, self.TABLES_MODULE + '.py')
+            with open(temporary_file, 'a') as tables:
+                tables.write('_rules_fingerprint = %r\n' % fingerprint)
+            os.replace(temporary_file, os.path.join(self.TABLES_DIRECTORY, self.TABLES_MODULE + '.py'))
+        except OSError:
+            pass
+        finally:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+
     @staticmethod
     def t_ANY_error(t: lex.Token) -> None:
         t.lexer.skip(1)
@@ -128,17 +214,31 @@ class Lexer(object):
         t.lexer.pop_state()
         t.lexer.lineno += len(t.value)
 
-    def analyze(self, data: str) -> list:
-        self.lexer.input(data)
+    def analyze(self, data: str, limit: int = None) -> list:
+        self.__reset()
+        return list(itertools.islice(self.__tokenize(data, 0), limit))
+
+    def analyze_chunks(self, chunks: Iterable[str]) -> Iterator[Tuple[str, Iterator[lex.LexToken]]]:
+        self.__reset()
+        start = 0
+        for chunk in chunks:
+            data = '\n' + chunk if start else chunk
+            yield data, self.__tokenize(data, start)
+            start = 1
+
+    def __reset(self) -> None:
         self.lexer.lineno = 1
+        self.lexer.begin('INITIAL')
+        self.lexer.lexstatestack = []
         self.is_in_function = False
 
-        tokens = []
+    def __tokenize(self, data: str, start: int) -> Iterator[lex.LexToken]:
+        self.lexer.input(data)
+        self.lexer.lexpos = start
 
         while True:
             token = self.lexer.token()
             if not token:
                 break
-            tokens.append(token)
-
-        return tokens
+            if token.type in self.rules:
+                yield token
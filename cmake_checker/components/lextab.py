@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ADD_COMPILE_DEFINITIONS', 'ADD_COMPILE_OPTIONS', 'ADD_DEFINITIONS', 'CACHE_IN_SET', 'CLOSING_COMMAND_WITH_CLAUSE', 'COMPILE_FLAGS', 'ENDFUNCTION', 'FILE_GLOB', 'INCLUDE_DIRECTORIES', 'LINK_DIRECTORIES', 'LINK_LIBRARIES', 'MODIFY_ENV_VARIABLE', 'PARENT_DIR_ACCESS', 'PARENT_SCOPE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'bracketcomments': 'exclusive', 'declfunc': 'inclusive', 'targetsources': 'exclusive', 'setfunc': 'exclusive', 'disabled': 'exclusive', 'comments': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline>\\n+)|(?P<t_begin_bracketcomments>(([^\\\\]\\#)|.{0}\\#)(\\[=*\\[))|(?P<t_begin_declfunc>[ \\t]*function[ \\t]*\\()|(?P<t_begin_targetsources>[ \\t]*target_sources[ \\t]*\\()|(?P<t_begin_setfunc>set[ \\t]*\\()|(?P<t_INITIAL_targetsources_setfunc_begin_comments>([^\\\\]\\#)|.{0}\\#)|(?P<t_INCLUDE_DIRECTORIES>(^include_directories[ \\t]*\\()|([ \\t]+include_directories[ \\t]*\\())|(?P<t_LINK_DIRECTORIES>(^link_directories[ \\t]*\\()|([ \\t]+link_directories[ \\t]*\\())|(?P<t_LINK_LIBRARIES>(^link_libraries[ \\t]*\\()|([ \\t]+link_libraries[ \\t]*\\())|(?P<t_CLOSING_COMMAND_WITH_CLAUSE>(endif\\(.+\\))|(endmacro\\(.+\\))|(endforeach\\(.+\\)))|(?P<t_COMPILE_FLAGS>(CMAKE_CXX_FLAGS)|(CMAKE_C_FLAGS))|(?P<t_ADD_COMPILE_DEFINITIONS>add_compile_definitions[ \\t]*\\()|(?P<t_ADD_COMPILE_OPTIONS>add_compile_options[ \\t]*\\()|(?P<t_ADD_DEFINITIONS>add_definitions[ \\t]*\\()|(?P<t_FILE_GLOB>file[ \\t]*\\([ \\t]*GLOB)|(?P<t_INITIAL_bracketcomments_targetsources_setfunc_disabled_comments_ignore_CHARACTER>.)', [None, ('t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline', 'newline'), ('t_begin_bracketcomments', 'begin_bracketcomments'), None, None, None, ('t_begin_declfunc', 'begin_declfunc'), ('t_begin_targetsources', 'begin_targetsources'), ('t_begin_setfunc', 'begin_setfunc'), ('t_INITIAL_targetsources_setfunc_begin_comments', 'begin_comments'), None, (None, 'INCLUDE_DIRECTORIES'), None, None, (None, 'LINK_DIRECTORIES'), None, None, (None, 'LINK_LIBRARIES'), None, None, (None, 'CLOSING_COMMAND_WITH_CLAUSE'), None, None, None, (None, 'COMPILE_FLAGS'), None, None, (None, 'ADD_COMPILE_DEFINITIONS'), (None, 'ADD_COMPILE_OPTIONS'), (None, 'ADD_DEFINITIONS'), (None, 'FILE_GLOB'), (None, None)])], 'bracketcomments': [('(?P<t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline>\\n+)|(?P<t_bracketcomments_end>\\]=*\\])|(?P<t_INITIAL_bracketcomments_targetsources_setfunc_disabled_comments_ignore_CHARACTER>.)', [None, ('t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline', 'newline'), ('t_bracketcomments_end', 'end'), (None, None)])], 'declfunc': [('(?P<t_declfunc_ENDFUNCTION>endfunction\\(.+\\))|(?P<t_declfunc_end>endfunction\\([ \\t]*\\))', [None, ('t_declfunc_ENDFUNCTION', 'ENDFUNCTION'), ('t_declfunc_end', 'end')]), ('(?P<t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline>\\n+)|(?P<t_begin_bracketcomments>(([^\\\\]\\#)|.{0}\\#)(\\[=*\\[))|(?P<t_begin_declfunc>[ \\t]*function[ \\t]*\\()|(?P<t_begin_targetsources>[ \\t]*target_sources[ \\t]*\\()|(?P<t_begin_setfunc>set[ \\t]*\\()|(?P<t_INITIAL_targetsources_setfunc_begin_comments>([^\\\\]\\#)|.{0}\\#)|(?P<t_INCLUDE_DIRECTORIES>(^include_directories[ \\t]*\\()|([ \\t]+include_directories[ \\t]*\\())|(?P<t_LINK_DIRECTORIES>(^link_directories[ \\t]*\\()|([ \\t]+link_directories[ \\t]*\\())|(?P<t_LINK_LIBRARIES>(^link_libraries[ \\t]*\\()|([ \\t]+link_libraries[ \\t]*\\())|(?P<t_CLOSING_COMMAND_WITH_CLAUSE>(endif\\(.+\\))|(endmacro\\(.+\\))|(endforeach\\(.+\\)))|(?P<t_COMPILE_FLAGS>(CMAKE_CXX_FLAGS)|(CMAKE_C_FLAGS))|(?P<t_ADD_COMPILE_DEFINITIONS>add_compile_definitions[ \\t]*\\()|(?P<t_ADD_COMPILE_OPTIONS>add_compile_options[ \\t]*\\()|(?P<t_ADD_DEFINITIONS>add_definitions[ \\t]*\\()|(?P<t_FILE_GLOB>file[ \\t]*\\([ \\t]*GLOB)|(?P<t_INITIAL_bracketcomments_targetsources_setfunc_disabled_comments_ignore_CHARACTER>.)', [None, ('t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline', 'newline'), ('t_begin_bracketcomments', 'begin_bracketcomments'), None, None, None, ('t_begin_declfunc', 'begin_declfunc'), ('t_begin_targetsources', 'begin_targetsources'), ('t_begin_setfunc', 'begin_setfunc'), ('t_INITIAL_targetsources_setfunc_begin_comments', 'begin_comments'), None, (None, 'INCLUDE_DIRECTORIES'), None, None, (None, 'LINK_DIRECTORIES'), None, None, (None, 'LINK_LIBRARIES'), None, None, (None, 'CLOSING_COMMAND_WITH_CLAUSE'), None, None, None, (None, 'COMPILE_FLAGS'), None, None, (None, 'ADD_COMPILE_DEFINITIONS'), (None, 'ADD_COMPILE_OPTIONS'), (None, 'ADD_DEFINITIONS'), (None, 'FILE_GLOB'), (None, None)])], 'targetsources': [('(?P<t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline>\\n+)|(?P<t_targetsources_end>\\))|(?P<t_INITIAL_targetsources_setfunc_begin_comments>([^\\\\]\\#)|.{0}\\#)|(?P<t_targetsources_PARENT_DIR_ACCESS>\\.\\.\\/\\.\\.)|(?P<t_INITIAL_bracketcomments_targetsources_setfunc_disabled_comments_ignore_CHARACTER>.)', [None, ('t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline', 'newline'), ('t_targetsources_end', 'end'), ('t_INITIAL_targetsources_setfunc_begin_comments', 'begin_comments'), None, (None, 'PARENT_DIR_ACCESS'), (None, None)])], 'setfunc': [('(?P<t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline>\\n+)|(?P<t_setfunc_PARENT_SCOPE>[ \\t]+PARENT_SCOPE)|(?P<t_setfunc_end>\\))|(?P<t_INITIAL_targetsources_setfunc_begin_comments>([^\\\\]\\#)|.{0}\\#)|(?P<t_setfunc_CACHE_IN_SET>[ \\t]+CACHE)|(?P<t_setfunc_MODIFY_ENV_VARIABLE>[ \\t]*ENV\\{)|(?P<t_INITIAL_bracketcomments_targetsources_setfunc_disabled_comments_ignore_CHARACTER>.)', [None, ('t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline', 'newline'), ('t_setfunc_PARENT_SCOPE', 'PARENT_SCOPE'), ('t_setfunc_end', 'end'), ('t_INITIAL_targetsources_setfunc_begin_comments', 'begin_comments'), None, (None, 'CACHE_IN_SET'), (None, 'MODIFY_ENV_VARIABLE'), (None, None)])], 'disabled': [('(?P<t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline>\\n+)|(?P<t_disabled_end>cmake-check[ \\t]+enable)|(?P<t_INITIAL_bracketcomments_targetsources_setfunc_disabled_comments_ignore_CHARACTER>.)', [None, ('t_INITIAL_disabled_setfunc_targetsources_bracketcomments_newline', 'newline'), ('t_disabled_end', 'end'), (None, None)])], 'comments': [('(?P<t_comments_begin_disabled>cmake-check[ \\t]+disable)|(?P<t_comments_end>\\n+)|(?P<t_INITIAL_bracketcomments_targetsources_setfunc_disabled_comments_ignore_CHARACTER>.)', [None, ('t_comments_begin_disabled', 'begin_disabled'), ('t_comments_end', 'end'), (None, None)])]}
+_lexstateignore = {'INITIAL': '', 'declfunc': ''}
+_lexstateerrorf = {'INITIAL': 't_ANY_error', 'bracketcomments': 't_ANY_error', 'declfunc': 't_ANY_error', 'targetsources': 't_ANY_error', 'setfunc': 't_ANY_error', 'disabled': 't_ANY_error', 'comments': 't_ANY_error'}
+_lexstateeoff = {}
+_rules_fingerprint = '7cfea63181bfb04149f50199b97bb1034cb4ff8abc4a8a46d46440b9ca753f9b'
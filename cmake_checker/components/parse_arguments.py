@@ -2,6 +2,16 @@ import argparse
 import sys
 from pathlib import Path
 
+from .engines import ENGINES
+from .rules import RULES, RulesConfigError, load_rules_config, parse_rule_names, select_rules
+
+SERVE_COMMAND = 'serve'
+MERGE_COMMAND = 'merge'
+REPORTERS = ['console', 'junit', 'ndjson', 'sarif', 'partial']
+OPTIONS_UNSUPPORTED_BY_SERVER = ('changed_since', 'diff', 'diff_strip', 'diff_root', 'baseline', 'write_baseline',
+                                 'cache_dir', 'stats', 'profile', 'rules', 'disable_rules', 'config', 'shard',
+                                 'max_violations', 'jobs', 'engine')
+
 
 def file_or_dir(path: str) -> Path:
     new_path = Path(path)
@@ -11,8 +21,98 @@ def file_or_dir(path: str) -> Path:
     return new_path
 
 
-def parse_arguments() -> argparse.Namespace:
-    arguments_parser = argparse.ArgumentParser()
+def positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        msg = "%s is not a positive integer!" % value
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        msg = "%s is not a non-negative integer!" % value
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def shard(value: str):
+    from .shards import Shard, ShardError
+    try:
+        return Shard.parse(value)
+    except ShardError as error:
+        raise argparse.ArgumentTypeError(str(error))
+
+
+def rule_names(value: str) -> list:
+    try:
+        return parse_rule_names(value)
+    except RulesConfigError as error:
+        raise argparse.ArgumentTypeError(str(error))
+
+
+class ListRulesAction(argparse.Action):
+    def __init__(self, option_strings, dest, **kwargs):
+        super(ListRulesAction, self).__init__(option_strings, dest, nargs=0, default=argparse.SUPPRESS, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        for rule in RULES:
+            print('%-28s %s' % (rule.name, rule.description))
+        parser.exit()
+
+
+def add_rules_arguments(arguments_parser: argparse.ArgumentParser) -> None:
+    arguments_parser.add_argument('--rules',
+                                  type=rule_names,
+                                  help='Comma separated list of rules to check (default: all rules)'
+                                  )
+    arguments_parser.add_argument('--disable-rules',
+                                  type=rule_names,
+                                  help='Comma separated list of rules not to check'
+                                  )
+    arguments_parser.add_argument('--config',
+                                  type=argparse.FileType('r'),
+                                  help='Config file with "enable" and "disable" lists of rules in [rules] section'
+                                  )
+    arguments_parser.add_argument('--list-rules',
+                                  action=ListRulesAction,
+                                  help='Show available rules and exit'
+                                  )
+
+
+def resolve_rules(arguments_parser: argparse.ArgumentParser, arguments: argparse.Namespace) -> frozenset:
+    enabled, disabled = None, []
+    if arguments.config is not None:
+        try:
+            enabled, disabled = load_rules_config(arguments.config)
+        except RulesConfigError as error:
+            arguments_parser.error(str(error))
+    if arguments.rules is not None:
+        enabled = arguments.rules
+    return select_rules(enabled, disabled + (arguments.disable_rules or []))
+
+
+def parse_arguments(argv: list = None) -> argparse.Namespace:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == [SERVE_COMMAND]:
+        return parse_serve_arguments(argv[1:])
+    if argv[:1] == [MERGE_COMMAND]:
+        return parse_merge_arguments(argv[1:])
+    return parse_check_arguments(argv)
+
+
+def parse_check_arguments(argv: list) -> argparse.Namespace:
+    arguments_parser = argparse.ArgumentParser(epilog='Run "%(prog)s serve -h" to see options of the checking server '
+                                                      'and "%(prog)s merge -h" to see how to merge sharded results')
+    arguments_parser.set_defaults(command='check')
 
     arguments_parser.add_argument('PATH',
                                   type=file_or_dir,
@@ -24,9 +124,9 @@ def parse_arguments() -> argparse.Namespace:
                                   help='Program will return 0 even if violations are found'
                                   )
     arguments_parser.add_argument('--reporter',
-                                  choices=['console', 'junit'],
+                                  choices=REPORTERS,
                                   default='console',
-                                  help='Specify type of reporter to output'
+                                  help='Specify type of reporter to output ("partial" can be combined with "merge")'
                                   )
     arguments_parser.add_argument('-o',
                                   '--output-file',
@@ -34,8 +134,190 @@ def parse_arguments() -> argparse.Namespace:
                                   default=sys.stdout,
                                   help='Output results to file with given name'
                                   )
+    arguments_parser.add_argument('--max-violations',
+                                  type=positive_int,
+                                  metavar='N',
+                                  help='Stop checking and report violations found so far once N violations are found'
+                                  )
+    arguments_parser.add_argument('--fail-fast',
+                                  dest='max_violations',
+                                  action='store_const',
+                                  const=1,
+                                  help='Stop checking at the first violation (same as --max-violations 1)'
+                                  )
     arguments_parser.add_argument('--whitelist',
                                   type=argparse.FileType('r'),
                                   help='Whitelist file with rules to ignore certain files or dirs (.gitignore style)'
                                   )
-    return arguments_parser.parse_args()
+    arguments_parser.add_argument('--changed-since',
+                                  metavar='REF',
+                                  help='Verify only cmake files changed relative to given git reference'
+                                  )
+    arguments_parser.add_argument('--diff',
+                                  type=argparse.FileType('r'),
+                                  help='Report only violations on lines added in given unified diff ("-" for stdin)'
+                                  )
+    arguments_parser.add_argument('--diff-strip',
+                                  type=non_negative_int,
+                                  metavar='N',
+                                  help='Strip N leading components from file names in --diff, like patch -p '
+                                       '(default: 1)'
+                                  )
+    arguments_parser.add_argument('--diff-root',
+                                  metavar='DIR',
+                                  help='Directory file names in --diff are relative to (default: top level of git '
+                                       'repository, otherwise current directory)'
+                                  )
+    arguments_parser.add_argument('--shard',
+                                  type=shard,
+                                  metavar='I/N',
+                                  help='Verify only I-th of N deterministic slices of found files (1 <= I <= N)'
+                                  )
+    arguments_parser.add_argument('--project-graph',
+                                  action='store_true',
+                                  help='Resolve include() and add_subdirectory() between checked files and do not '
+                                       'report PARENT_SCOPE in files included only from inside functions'
+                                  )
+    arguments_parser.add_argument('--baseline',
+                                  type=argparse.FileType('r'),
+                                  help='Report only violations not recorded in given baseline file'
+                                  )
+    arguments_parser.add_argument('--write-baseline',
+                                  metavar='FILE',
+                                  type=Path,
+                                  help='Record all found violations in baseline file with given name'
+                                  )
+    arguments_parser.add_argument('-j',
+                                  '--jobs',
+                                  type=positive_int,
+                                  help='Number of worker processes used to verify files (default: number of CPUs)'
+                                  )
+    arguments_parser.add_argument('--engine',
+                                  choices=sorted(ENGINES),
+                                  help='Scanner used to find violations, "fast" gives the same results as "ply" '
+                                       'without per character overhead (default: ply)'
+                                  )
+    arguments_parser.add_argument('--cache-dir',
+                                  type=Path,
+                                  help='Directory used to cache results of unchanged files between runs'
+                                  )
+    arguments_parser.add_argument('--cache-max-size',
+                                  type=positive_int,
+                                  default=100,
+                                  help='Maximum size of the cache directory in MiB (default: 100)'
+                                  )
+    arguments_parser.add_argument('--cache-max-age',
+                                  type=positive_int,
+                                  default=30,
+                                  help='Number of days after which unused cache entries are removed (default: 30)'
+                                  )
+    arguments_parser.add_argument('--stats',
+                                  type=argparse.FileType('w'),
+                                  help='Write timing statistics of the run as JSON to file with given name'
+                                  )
+    arguments_parser.add_argument('--stats-slowest',
+                                  type=positive_int,
+                                  default=10,
+                                  help='Number of slowest files listed in statistics (default: 10)'
+                                  )
+    arguments_parser.add_argument('--profile',
+                                  metavar='FILE',
+                                  help='Run under cProfile and dump profiling data to file with given name'
+                                  )
+    arguments_parser.add_argument('--server',
+                                  metavar='SOCKET',
+                                  help='Get results from checking server listening on given socket (see "serve")'
+                                  )
+    add_rules_arguments(arguments_parser)
+    arguments = arguments_parser.parse_args(argv)
+    arguments.selected_rules = resolve_rules(arguments_parser, arguments)
+
+    if arguments.max_violations is not None and arguments.write_baseline is not None:
+        arguments_parser.error('--max-violations and --fail-fast can not be used together with --write-baseline')
+    if arguments.server is not None:
+        for option in OPTIONS_UNSUPPORTED_BY_SERVER:
+            if getattr(arguments, option) is not None:
+                arguments_parser.error('--server can not be used together with --%s' % option.replace('_', '-'))
+        return arguments
+
+    from .verifier import default_jobs
+    if arguments.jobs is None:
+        arguments.jobs = default_jobs()
+    if arguments.engine is None:
+        arguments.engine = 'ply'
+    return arguments
+
+
+def parse_merge_arguments(argv: list) -> argparse.Namespace:
+    arguments_parser = argparse.ArgumentParser(prog='%s %s' % (Path(sys.argv[0]).name, MERGE_COMMAND),
+                                               description='Merge results of all "--shard I/N --reporter partial" '
+                                                           'runs into a single report')
+    arguments_parser.set_defaults(command=MERGE_COMMAND)
+
+    arguments_parser.add_argument('PARTIAL',
+                                  type=argparse.FileType('r'),
+                                  nargs='+',
+                                  help='Partial results written by each of the shards'
+                                  )
+    arguments_parser.add_argument('--warn-only',
+                                  action='store_true',
+                                  help='Program will return 0 even if violations are found'
+                                  )
+    arguments_parser.add_argument('--reporter',
+                                  choices=REPORTERS,
+                                  default='console',
+                                  help='Specify type of reporter to output'
+                                  )
+    arguments_parser.add_argument('-o',
+                                  '--output-file',
+                                  type=argparse.FileType('w'),
+                                  default=sys.stdout,
+                                  help='Output results to file with given name'
+                                  )
+    return arguments_parser.parse_args(argv)
+
+
+def parse_serve_arguments(argv: list) -> argparse.Namespace:
+    from .client import default_socket_path
+    from .verifier import default_jobs
+    arguments_parser = argparse.ArgumentParser(prog='%s %s' % (Path(sys.argv[0]).name, SERVE_COMMAND),
+                                               description='Keep checking server running and answer check requests '
+                                                           'of "--server" clients')
+    arguments_parser.set_defaults(command=SERVE_COMMAND)
+
+    arguments_parser.add_argument('ROOT',
+                                  type=file_or_dir,
+                                  nargs='*',
+                                  default=[Path('.')],
+                                  help='Directory watched for changes (default: current directory)'
+                                  )
+    arguments_parser.add_argument('--socket',
+                                  default=default_socket_path(),
+                                  help='Unix socket to listen on (default: %(default)s)'
+                                  )
+    arguments_parser.add_argument('-j',
+                                  '--jobs',
+                                  type=positive_int,
+                                  default=default_jobs(),
+                                  help='Number of worker processes used to verify files (default: number of CPUs)'
+                                  )
+    arguments_parser.add_argument('--engine',
+                                  choices=sorted(ENGINES),
+                                  default='ply',
+                                  help='Scanner used to find violations, "fast" gives the same results as "ply" '
+                                       'without per character overhead (default: ply)'
+                                  )
+    arguments_parser.add_argument('--watcher',
+                                  choices=['auto', 'inotify', 'polling'],
+                                  default='auto',
+                                  help='How changes in watched directories are detected (default: auto)'
+                                  )
+    arguments_parser.add_argument('--poll-interval',
+                                  type=float,
+                                  default=1.0,
+                                  help='Seconds between scans of watched directories when polling (default: 1.0)'
+                                  )
+    add_rules_arguments(arguments_parser)
+    arguments = arguments_parser.parse_args(argv)
+    arguments.selected_rules = resolve_rules(arguments_parser, arguments)
+    return arguments
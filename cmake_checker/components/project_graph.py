@@ -0,0 +1,177 @@
+import collections
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple
+
+from .violations import Violations
+
+FileSummary = collections.namedtuple('FileSummary', ['includes', 'subdirectories'])
+
+
+class ProjectGraph(object):
+    COMMENT = re.compile(br'#\[(=*)\[.*?\]\1\]|#[^\n]*', re.S)
+    COMMAND = re.compile(br'^[ \t]*(function|endfunction|include|add_subdirectory)[ \t]*\(([^)]*)\)', re.M | re.I)
+    ARGUMENT = re.compile(br'"([^"]*)"|([^\s"]+)')
+    DIRECTORY_VARIABLES = ('${CMAKE_CURRENT_LIST_DIR}', '${CMAKE_CURRENT_SOURCE_DIR}')
+    MODULE_SUFFIX = '.cmake'
+    DIRECTORY_FILE = 'CMakeLists.txt'
+
+    def __init__(self):
+        self.summaries = {}
+        self.nodes = frozenset()
+        self.modules = {}
+        self.edges = {}
+        self.includers = collections.defaultdict(set)
+        self.function_scopes = {}
+
+    @classmethod
+    def summarize(cls, content: bytes) -> FileSummary:
+        includes = []
+        subdirectories = []
+        function_depth = 0
+        for match in cls.COMMAND.finditer(cls.COMMENT.sub(b'', content)):
+            command = match.group(1).lower()
+            if command == b'function':
+                function_depth = function_depth + 1
+            elif command == b'endfunction':
+                function_depth = max(function_depth - 1, 0)
+            else:
+                argument = cls.ARGUMENT.search(match.group(2))
+                if argument is None:
+                    continue
+                argument = os.fsdecode(argument.group(1) if argument.group(1) is not None else argument.group(2))
+                if command == b'include':
+                    includes.append((argument, function_depth > 0))
+                else:
+                    subdirectories.append(argument)
+        return FileSummary(tuple(includes), tuple(subdirectories))
+
+    def select_violations(self, files_with_info: Iterable) -> Iterator[Tuple[Path, Violations]]:
+        results = list(files_with_info)
+        if any(violation_type == 'PARENT_SCOPE' for _, violations in results for violation_type, _ in violations):
+            self.update(file for file, _ in results)
+        for file, violations in results:
+            if violations and self.is_in_function_scope(file):
+                violations = violations.select(lambda violation_type, line: violation_type != 'PARENT_SCOPE')
+            yield file, violations
+
+    def update(self, files: Iterable[Path]) -> set:
+        nodes = frozenset(os.path.abspath(str(file)) for file in files)
+        changed = [path for path in nodes if self.__refresh_summary(path)]
+
+        if nodes != self.nodes:
+            self.nodes = nodes
+            self.__rebuild()
+            return set(nodes)
+
+        affected = set()
+        for path in changed:
+            affected.update(self.__descendants(self.edges[path]))
+            self.__remove_edges(path)
+            self.__add_edges(path)
+            affected.update(self.__descendants(self.edges[path]))
+        for path in affected:
+            self.function_scopes.pop(path, None)
+        return affected
+
+    def is_in_function_scope(self, file: Path) -> bool:
+        return self.__is_in_function_scope(os.path.abspath(str(file)), set())
+
+    def __is_in_function_scope(self, path: str, visiting: set) -> bool:
+        if path in self.function_scopes:
+            return self.function_scopes[path]
+
+        visiting.add(path)
+        includers = self.includers.get(path)
+        result = bool(includers) and all(
+            in_function or in_function is not None and source not in visiting and
+            self.__is_in_function_scope(source, visiting) for source, in_function in includers)
+        visiting.discard(path)
+        self.function_scopes[path] = result
+        return result
+
+    def __refresh_summary(self, path: str) -> bool:
+        try:
+            status = os.stat(path)
+            state = status.st_mtime_ns, status.st_size
+        except OSError:
+            state = None
+
+        cached = self.summaries.get(path)
+        if cached is not None and cached[0] == state:
+            return False
+
+        summary = FileSummary((), ())
+        if state is not None:
+            try:
+                with open(path, 'rb') as file:
+                    summary = self.summarize(file.read())
+            except OSError:
+                pass
+        self.summaries[path] = (state, summary)
+        return cached is None or cached[1] != summary
+
+    def __rebuild(self) -> None:
+        self.modules = collections.defaultdict(list)
+        for path in self.nodes:
+            name = os.path.basename(path)
+            if name.endswith(self.MODULE_SUFFIX):
+                self.modules[name[:-len(self.MODULE_SUFFIX)]].append(path)
+        self.edges = {}
+        self.includers = collections.defaultdict(set)
+        self.function_scopes = {}
+        for path in self.nodes:
+            self.__add_edges(path)
+
+    def __add_edges(self, path: str) -> None:
+        summary = self.summaries[path][1]
+        edges = [(self.__resolve_include(path, argument), in_function) for argument, in_function in summary.includes]
+        edges.extend((self.__resolve_subdirectory(path, argument), None) for argument in summary.subdirectories)
+        self.edges[path] = [(target, in_function) for target, in_function in edges if target is not None]
+        for target, in_function in self.edges[path]:
+            self.includers[target].add((path, in_function))
+
+    def __remove_edges(self, path: str) -> None:
+        for target, in_function in self.edges.pop(path, []):
+            self.includers[target].discard((path, in_function))
+
+    def __descendants(self, edges: list) -> set:
+        found = set()
+        pending = [target for target, _ in edges]
+        while pending:
+            path = pending.pop()
+            if path not in found:
+                found.add(path)
+                pending.extend(target for target, _ in self.edges.get(path, []))
+        return found
+
+    def __resolve_include(self, source: str, argument: str):
+        argument = self.__expand(source, argument)
+        if argument is None:
+            return None
+        if '/' not in argument and not argument.endswith(self.MODULE_SUFFIX):
+            modules = self.modules.get(argument, [])
+            return modules[0] if len(modules) == 1 else None
+
+        directory = os.path.dirname(source)
+        while True:
+            target = os.path.normpath(os.path.join(directory, argument))
+            if target in self.nodes:
+                return target
+            parent = os.path.dirname(directory)
+            if os.path.isabs(argument) or parent == directory:
+                return None
+            directory = parent
+
+    def __resolve_subdirectory(self, source: str, argument: str):
+        argument = self.__expand(source, argument)
+        if argument is None:
+            return None
+        target = os.path.normpath(os.path.join(os.path.dirname(source), argument, self.DIRECTORY_FILE))
+        return target if target in self.nodes else None
+
+    def __expand(self, source: str, argument: str):
+        for variable in self.DIRECTORY_VARIABLES:
+            argument = argument.replace(variable, os.path.dirname(source))
+        return None if '${' in argument else argument
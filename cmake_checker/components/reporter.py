@@ -1,63 +1,63 @@
+import io
+import json
+import re
 from pathlib import Path
-from junit_xml import TestSuite, TestCase
+from typing import Iterable, TextIO
 
-
-class LineReader(object):
-    def __init__(self, file):
-        self.current_line = ''
-        self.current_line_number = 0
-        self.file = file
-
-    def get(self, line):
-        while self.current_line_number != line:
-            self.current_line_number = self.current_line_number + 1
-            self.current_line = self.file.readline()
-
-        return self.current_line
+from cmake_checker import __version__
+from .rules import RULE_NAMES
+from .violations import Violations
 
 
 class Reporter(object):
     @staticmethod
-    def create(reporter_type: str, files_with_info: list):
+    def create(reporter_type: str, files_with_info: Iterable, shard=None):
         if reporter_type == 'console':
             return ConsoleReporter(files_with_info)
         elif reporter_type == 'junit':
             return JUnitReporter(files_with_info)
+        elif reporter_type == 'ndjson':
+            return NDJSONReporter(files_with_info)
+        elif reporter_type == 'sarif':
+            return SarifReporter(files_with_info)
+        elif reporter_type == 'partial':
+            return PartialReporter(files_with_info, shard)
         return None
 
+    def generate_report(self) -> str:
+        output = io.StringIO()
+        self.write_report(output)
+        return output.getvalue()
+
+    def write_report(self, output: TextIO) -> None:
+        raise NotImplementedError
+
 
 class ConsoleReporter(Reporter):
-    def __init__(self, files_with_info: list):
+    def __init__(self, files_with_info: Iterable):
         self.files_with_info = files_with_info
+        self.files_number = 0
         self.violations = 0
 
-    def generate_report(self) -> str:
-        output = ''
+    def write_report(self, output: TextIO) -> None:
         for file, violations in self.files_with_info:
-            output += self.__generate_file_output(file, violations)
+            self.files_number = self.files_number + 1
+            if violations:
+                self.__write_file_output(output, file, violations)
+                output.flush()
 
-        return output + '\n' + self.__create_summary()
+        output.write('\n')
+        output.write(self.__create_summary())
 
     def __create_summary(self) -> str:
-        files_number = len(self.files_with_info)
-        return "Scanned %d file(s). Found %d issues.\n" % (files_number, self.violations)
+        return "Scanned %d file(s). Found %d issues.\n" % (self.files_number, self.violations)
 
-    def __generate_file_output(self, file: Path, violations: list) -> str:
-        output = ''
-        if violations:
-            with file.open() as cmake_file:
-                line_reader = LineReader(cmake_file)
-                output += "\n>>>" + str(file) + '<<<\n'
-                output += self.__generate_file_violations(line_reader, violations)
-        return output
-
-    def __generate_file_violations(self, line_reader: LineReader, violations: list):
-        output = ''
+    def __write_file_output(self, output: TextIO, file: Path, violations: Violations) -> None:
+        output.write("\n>>>" + str(file) + '<<<\n')
         for (violation_type, line_number) in violations:
             self.violations = self.violations + 1
-            output += self.__generate_new_violation_prefix(line_number, violation_type)
-            output += line_reader.get(line_number)
-        return output
+            output.write(self.__generate_new_violation_prefix(line_number, violation_type))
+            output.write(violations.source_line(line_number))
 
     @staticmethod
     def __generate_new_violation_prefix(line_number: int, violation_type: str):
@@ -65,46 +65,138 @@ class ConsoleReporter(Reporter):
 
 
 class JUnitReporter(Reporter):
-    def __init__(self, files_with_info: list):
+    SPOOL_MAX_SIZE = 8 * 1024 * 1024
+    ILLEGAL_XML_CHARACTERS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+    def __init__(self, files_with_info: Iterable):
         self.files_with_info = files_with_info
+        self.tests = 0
+        self.failures = 0
+
+    def write_report(self, output: TextIO) -> None:
+        import shutil
+        import tempfile
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE, mode='w+') as test_suites:
+            for file, violations in self.files_with_info:
+                test_suites.write(self.__generate_test_suite(file, violations))
+            if not self.tests:
+                test_suites.write(self.__generate_empty_test_suite())
+
+            output.write('<?xml version="1.0" ?>\n')
+            output.write(self.__generate_element('testsuites', [('disabled', 0), ('errors', 0),
+                                                                ('failures', self.failures), ('tests', self.tests),
+                                                                ('time', 0.0)]) + '>\n')
+            test_suites.seek(0)
+            shutil.copyfileobj(test_suites, output)
+            output.write('</testsuites>\n')
+
+    def __generate_test_suite(self, file: Path, violations: Violations) -> str:
+        if violations:
+            test_cases = [self.__generate_failed_test_case(violation, line_number, violations)
+                          for (violation, line_number) in violations]
+        else:
+            test_cases = [self.__generate_test_case('No violations found')]
+        return self.__wrap_test_cases(str(file), len(violations), test_cases)
+
+    def __generate_empty_test_suite(self) -> str:
+        return self.__wrap_test_cases('cmake-checker', 0, [self.__generate_test_case('No cmake files found')])
+
+    def __wrap_test_cases(self, name: str, failures: int, test_cases: list) -> str:
+        self.tests = self.tests + len(test_cases)
+        self.failures = self.failures + failures
+        attributes = [('disabled', 0), ('errors', 0), ('failures', failures), ('name', name), ('skipped', 0),
+                      ('tests', len(test_cases)), ('time', 0)]
+        test_suite = self.__generate_element('testsuite', attributes)
+        return '\t' + test_suite + '>\n' + ''.join(test_cases) + '\t</testsuite>\n'
+
+    def __generate_test_case(self, name: str) -> str:
+        return '\t\t' + self.__generate_element('testcase', [('name', name)]) + '/>\n'
+
+    def __generate_failed_test_case(self, violation_type: str, line_number: int, violations: Violations) -> str:
+        message = self.__generate_failure_info(line_number, violation_type, violations.source_line(line_number))
+        return '\t\t' + self.__generate_element('testcase', [('line', line_number), ('name', violation_type)]) + '>\n' \
+               + '\t\t\t' + self.__generate_element('failure', [('message', message), ('type', 'failure')]) + '/>\n' \
+               + '\t\t</testcase>\n'
 
-    def generate_report(self) -> str:
-        test_suites = self.__generate_test_suites()
-        if not test_suites:
-            test_suites = self.__generate_empty_test_suites()
-        return TestSuite.to_xml_string(test_suites, prettyprint=True)
+    @staticmethod
+    def __generate_failure_info(line_number: int, violation_type: str, source_line: str) -> str:
+        return "line: %4s %20s> %s" % (line_number, violation_type, source_line)
+
+    @classmethod
+    def __generate_element(cls, tag: str, attributes: list) -> str:
+        return '<' + tag + ''.join(' %s="%s"' % (name, cls.__escape(str(value))) for name, value in attributes)
 
-    def __generate_test_suites(self) -> list:
-        test_suites = []
-        for file_with_info in self.files_with_info:
-            test_suites.append(self.__create_test_suite_for(file_with_info))
-        return test_suites
+    @classmethod
+    def __escape(cls, value: str) -> str:
+        value = cls.ILLEGAL_XML_CHARACTERS.sub('', value)
+        return value.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
 
-    def __create_test_suite_for(self, file__with_info) -> TestSuite:
-        test_case_list = self.__create_test_cases(file__with_info[0], file__with_info[1])
-        return TestSuite(file__with_info[0], test_case_list)
 
-    def __create_test_cases(self, file: Path, violations: list) -> list:
-        with file.open() as cmake_file:
-            line_reader = LineReader(cmake_file)
+class NDJSONReporter(Reporter):
+    def __init__(self, files_with_info: Iterable):
+        self.files_with_info = files_with_info
 
+    def write_report(self, output: TextIO) -> None:
+        for file, violations in self.files_with_info:
+            for violation_type, line_number in violations:
+                output.write(json.dumps({'file': str(file), 'line': line_number, 'rule': violation_type,
+                                         'source': violations.source_line(line_number).rstrip('\r\n')}) + '\n')
             if violations:
-                return self.__generate_failed_tests_list(violations, line_reader)
-            else:
-                return [TestCase(name='No violations found')]
-
-    def __generate_failed_tests_list(self, violations: list, line_reader: LineReader) -> list:
-        test_cases = []
-        for (violation, line_number) in violations:
-            test_case = TestCase(name=violation, line=line_number)
-            test_case.add_failure_info(message=self.__generate_failure_info(line_number, violation, line_reader))
-            test_cases.append(test_case)
-        return test_cases
+                output.flush()
+
+
+class PartialReporter(Reporter):
+    def __init__(self, files_with_info: Iterable, shard=None):
+        self.files_with_info = files_with_info
+        self.shard = shard
+
+    def write_report(self, output: TextIO) -> None:
+        shard = [self.shard.index, self.shard.count] if self.shard is not None else [1, 1]
+        from .shards import PartialResults
+        output.write(json.dumps({'version': PartialResults.VERSION, 'shard': shard}) + '\n')
+        for position, (file, violations) in enumerate(self.files_with_info):
+            if self.shard is not None:
+                position = self.shard.positions[file]
+            lines = sorted(set(line_number for _, line_number in violations))
+            output.write(json.dumps({'position': position, 'file': str(file),
+                                     'violations': [list(violation) for violation in violations],
+                                     'sources': {line: violations.source_line(line) for line in lines}}) + '\n')
+
+
+class SarifReporter(Reporter):
+    SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+    TOOL_URI = 'https://github.com/MaciejPatro/cmake-checker'
+
+    def __init__(self, files_with_info: Iterable):
+        self.files_with_info = files_with_info
+
+    def write_report(self, output: TextIO) -> None:
+        driver = {'name': 'cmake-checker', 'version': __version__, 'informationUri': self.TOOL_URI,
+                  'rules': [{'id': rule} for rule in RULE_NAMES]}
+        output.write('{"$schema": %s, "version": "2.1.0", "runs": [{"tool": {"driver": %s}, "results": ['
+                     % (json.dumps(self.SCHEMA), json.dumps(driver)))
+
+        separator = '\n'
+        for file, violations in self.files_with_info:
+            uri = self.__file_uri(file)
+            for violation_type, line_number in violations:
+                output.write(separator + json.dumps(self.__generate_result(uri, violation_type, line_number,
+                                                                           violations.source_line(line_number))))
+                separator = ',\n'
+
+        output.write('\n]}]}\n')
 
     @staticmethod
-    def __generate_failure_info(line_number: int, violation_type: str, line_reader: LineReader) -> str:
-        return "line: %4s %20s> %s" % (line_number, violation_type, line_reader.get(line_number))
+    def __generate_result(uri: str, violation_type: str, line_number: int, source_line: str) -> dict:
+        region = {'startLine': line_number}
+        if source_line:
+            region['snippet'] = {'text': source_line}
+        return {'ruleId': violation_type, 'level': 'error', 'message': {'text': violation_type},
+                'locations': [{'physicalLocation': {'artifactLocation': {'uri': uri}, 'region': region}}]}
 
     @staticmethod
-    def __generate_empty_test_suites() -> list:
-        return [TestSuite('cmake-checker', [TestCase(name='No cmake files found')])]
+    def __file_uri(file: Path) -> str:
+        if file.is_absolute():
+            return file.as_uri()
+        from urllib.parse import quote
+        return quote(file.as_posix())
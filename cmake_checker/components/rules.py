@@ -0,0 +1,86 @@
+import codecs
+import locale
+import re
+from collections import namedtuple
+from typing import Iterable, TextIO
+
+Rule = namedtuple('Rule', ['name', 'keywords', 'description'])
+
+RULES = (
+    Rule('FILE_GLOB', ('GLOB',), 'file(GLOB) used to collect files'),
+    Rule('ADD_COMPILE_OPTIONS', ('add_compile_options',), 'Directory wide add_compile_options()'),
+    Rule('INCLUDE_DIRECTORIES', ('include_directories',), 'Directory wide include_directories()'),
+    Rule('LINK_DIRECTORIES', ('link_directories',), 'Directory wide link_directories()'),
+    Rule('LINK_LIBRARIES', ('link_libraries',), 'Directory wide link_libraries()'),
+    Rule('COMPILE_FLAGS', ('CMAKE_CXX_FLAGS', 'CMAKE_C_FLAGS'), 'CMAKE_CXX_FLAGS or CMAKE_C_FLAGS used'),
+    Rule('CLOSING_COMMAND_WITH_CLAUSE', ('endif(', 'endmacro(', 'endforeach('),
+         'endif(), endmacro() or endforeach() repeating the opening clause'),
+    Rule('ADD_DEFINITIONS', ('add_definitions',), 'Directory wide add_definitions()'),
+    Rule('ADD_COMPILE_DEFINITIONS', ('add_compile_definitions',), 'Directory wide add_compile_definitions()'),
+    Rule('MODIFY_ENV_VARIABLE', ('ENV{',), 'Environment variable modified with set()'),
+    Rule('CACHE_IN_SET', ('CACHE',), 'Cache variable set with set()'),
+    Rule('PARENT_DIR_ACCESS', ('../..',), 'target_sources() reaching out of parent directory'),
+    Rule('ENDFUNCTION', ('endfunction(',), 'endfunction() repeating the function name'),
+    Rule('PARENT_SCOPE', ('PARENT_SCOPE',), 'Variable set in PARENT_SCOPE outside of a function'),
+)
+
+RULE_NAMES = tuple(rule.name for rule in RULES)
+
+
+class RulesConfigError(Exception):
+    pass
+
+
+def parse_rule_names(text: str) -> list:
+    names = [name.strip() for name in text.split(',') if name.strip()]
+    unknown = [name for name in names if name not in RULE_NAMES]
+    if unknown:
+        raise RulesConfigError('Unknown rule(s): %s (available: %s)' % (', '.join(unknown), ', '.join(RULE_NAMES)))
+    return names
+
+
+def select_rules(enabled: Iterable[str] = None, disabled: Iterable[str] = ()) -> frozenset:
+    selected = set(RULE_NAMES if enabled is None else enabled)
+    return frozenset(selected.difference(disabled))
+
+
+def load_rules_config(config_file: TextIO) -> tuple:
+    import configparser
+    config = configparser.ConfigParser()
+    try:
+        config.read_file(config_file)
+    except configparser.Error as error:
+        raise RulesConfigError('Invalid config file %s: %s' % (getattr(config_file, 'name', ''), error))
+
+    enabled = None
+    disabled = []
+    if config.has_option('rules', 'enable'):
+        enabled = parse_rule_names(config.get('rules', 'enable'))
+    if config.has_option('rules', 'disable'):
+        disabled = parse_rule_names(config.get('rules', 'disable'))
+    return enabled, disabled
+
+
+class Prefilter(object):
+    def __init__(self, rules: Iterable[str], encoding: str = None):
+        keywords = [keyword for rule in RULES if rule.name in rules for keyword in rule.keywords]
+        self.matches_nothing = not keywords
+        self.regex = None
+        self.text_regex = re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+        if keywords and self.__is_ascii_compatible(encoding or locale.getpreferredencoding(False)):
+            self.regex = re.compile(b'|'.join(re.escape(keyword.encode('ascii')) for keyword in keywords))
+
+    def may_match(self, content) -> bool:
+        if self.matches_nothing:
+            return False
+        regex = self.text_regex if isinstance(content, str) else self.regex
+        return regex is None or regex.search(content) is not None
+
+    @staticmethod
+    def __is_ascii_compatible(encoding: str) -> bool:
+        try:
+            codecs.lookup(encoding)
+            sample = ''.join(chr(character) for character in range(128))
+            return sample.encode(encoding) == sample.encode('ascii')
+        except (LookupError, UnicodeError):
+            return False
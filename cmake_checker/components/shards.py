@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO, Tuple
+
+from .violations import Violations
+
+
+class ShardError(Exception):
+    pass
+
+
+class Shard(object):
+    def __init__(self, index: int, count: int):
+        if count < 1 or not 1 <= index <= count:
+            raise ShardError('Invalid shard %d/%d, expected i/N with 1 <= i <= N' % (index, count))
+        self.index = index
+        self.count = count
+        self.positions = {}
+
+    @classmethod
+    def parse(cls, text: str) -> 'Shard':
+        try:
+            index, count = (int(part) for part in text.split('/'))
+        except ValueError:
+            raise ShardError('Invalid shard "%s", expected i/N' % text)
+        return cls(index, count)
+
+    def contains(self, file: Path) -> bool:
+        key = str(file).replace(os.sep, '/').encode('utf-8', 'surrogateescape')
+        return int(hashlib.sha1(key).hexdigest(), 16) % self.count == self.index - 1
+
+    def select_files(self, files: Iterable[Path]) -> Iterator[Path]:
+        for position, file in enumerate(files):
+            if self.contains(file):
+                self.positions[file] = position
+                yield file
+
+    def __str__(self) -> str:
+        return '%d/%d' % (self.index, self.count)
+
+
+class PartialResults(object):
+    VERSION = 1
+
+    def __init__(self):
+        self.shards = set()
+        self.count = None
+        self.files = []
+
+    @classmethod
+    def merge(cls, streams: Iterable[TextIO]) -> 'PartialResults':
+        results = cls()
+        for stream in streams:
+            results.read(stream)
+        results.verify_complete()
+        return results
+
+    def read(self, stream: TextIO) -> None:
+        name = getattr(stream, 'name', '')
+        try:
+            header = json.loads(stream.readline())
+            if header.get('version') != self.VERSION:
+                raise ShardError('Unsupported partial results version in %s: %s' % (name, header.get('version')))
+            index, count = header['shard']
+            for line in stream:
+                entry = json.loads(line)
+                self.files.append((entry['position'], entry['file'], entry['violations'], entry['sources']))
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            raise ShardError('Invalid partial results file %s: %s' % (name, error))
+
+        if self.count is not None and count != self.count:
+            raise ShardError('Partial results of %s were split into %d shards, expected %d' % (name, count, self.count))
+        if index in self.shards:
+            raise ShardError('Shard %d/%d given more than once (%s)' % (index, count, name))
+        self.count = count
+        self.shards.add(index)
+
+    def verify_complete(self) -> None:
+        missing = sorted(set(range(1, (self.count or 0) + 1)) - self.shards)
+        if missing:
+            raise ShardError('Missing partial results of shard(s): %s' %
+                             ', '.join('%d/%d' % (index, self.count) for index in missing))
+
+    def files_with_info(self) -> Iterator[Tuple[Path, Violations]]:
+        for _, file, violation_list, sources in sorted(self.files, key=lambda entry: entry[0]):
+            violations = Violations()
+            for violation_type, line in violation_list:
+                violations.append(violation_type, line)
+            violations.source_lines.update((int(line), source) for line, source in sources.items())
+            yield Path(file), violations
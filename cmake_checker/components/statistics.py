@@ -0,0 +1,127 @@
+import contextlib
+import heapq
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+FileMeasurement = namedtuple('FileMeasurement', ['size', 'read_wall', 'read_cpu', 'lex_wall', 'lex_cpu', 'violations'])
+
+
+_thread_time = getattr(time, 'thread_time', time.process_time)
+
+
+def _now() -> tuple:
+    return time.perf_counter(), _thread_time()
+
+
+class Stopwatch(object):
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    @contextlib.contextmanager
+    def measure(self):
+        start_wall, start_cpu = _now()
+        try:
+            yield
+        finally:
+            end_wall, end_cpu = _now()
+            self.wall = self.wall + end_wall - start_wall
+            self.cpu = self.cpu + end_cpu - start_cpu
+
+
+class Statistics(object):
+    def __init__(self, slowest_files_number: int = 10):
+        self.slowest_files_number = slowest_files_number
+        self.phases = {}
+        self.file_phases = {}
+        self.files = 0
+        self.bytes = 0
+        self.slowest_files = []
+        self.start_wall = time.perf_counter()
+        self.start_times = os.times()
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+
+    @contextlib.contextmanager
+    def measure(self, phase: str):
+        stack = self.__phase_stack()
+        now = _now()
+        if stack:
+            self.__accumulate(stack[-1], now)
+        stack.append([phase, now])
+        try:
+            yield
+        finally:
+            now = _now()
+            self.__accumulate(stack.pop(), now)
+            if stack:
+                stack[-1][1] = now
+
+    def timed(self, phase: str, iterable: Iterable) -> Iterator:
+        iterator = iter(iterable)
+        while True:
+            with self.measure(phase):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def record_file(self, file: Path, measurement: FileMeasurement) -> None:
+        with self.__lock:
+            self.files = self.files + 1
+            self.bytes = self.bytes + measurement.size
+            self.__add_to_phase(self.file_phases, 'file_io', measurement.read_wall, measurement.read_cpu)
+            self.__add_to_phase(self.file_phases, 'lexing', measurement.lex_wall, measurement.lex_cpu)
+
+            entry = (measurement.read_wall + measurement.lex_wall, str(file), measurement.size,
+                     measurement.violations)
+            if len(self.slowest_files) < self.slowest_files_number:
+                heapq.heappush(self.slowest_files, entry)
+            elif self.slowest_files and entry > self.slowest_files[0]:
+                heapq.heapreplace(self.slowest_files, entry)
+
+    def to_dict(self) -> dict:
+        wall_time = time.perf_counter() - self.start_wall
+        end_times = os.times()
+        cpu_time = sum(end - start for start, end in zip(self.start_times[:4], end_times[:4]))
+        return {
+            'wall_time': wall_time,
+            'cpu_time': cpu_time,
+            'phases': self.__phases_to_dict(self.phases),
+            'file_phases': self.__phases_to_dict(self.file_phases),
+            'files': self.files,
+            'bytes': self.bytes,
+            'files_per_second': self.files / wall_time if wall_time else 0.0,
+            'bytes_per_second': self.bytes / wall_time if wall_time else 0.0,
+            'slowest_files': [{'file': file, 'seconds': seconds, 'bytes': size, 'violations': violations}
+                              for seconds, file, size, violations in sorted(self.slowest_files, reverse=True)],
+        }
+
+    def write_json(self, output: TextIO) -> None:
+        json.dump(self.to_dict(), output, indent=2)
+        output.write('\n')
+
+    def __phase_stack(self) -> list:
+        if not hasattr(self.__local, 'stack'):
+            self.__local.stack = []
+        return self.__local.stack
+
+    def __accumulate(self, frame: list, now: tuple) -> None:
+        phase, (start_wall, start_cpu) = frame
+        with self.__lock:
+            self.__add_to_phase(self.phases, phase, now[0] - start_wall, now[1] - start_cpu)
+
+    @staticmethod
+    def __add_to_phase(phases: dict, phase: str, wall: float, cpu: float) -> None:
+        total_wall, total_cpu = phases.get(phase, (0.0, 0.0))
+        phases[phase] = (total_wall + wall, total_cpu + cpu)
+
+    @staticmethod
+    def __phases_to_dict(phases: dict) -> dict:
+        return {name: {'wall_time': wall, 'cpu_time': cpu} for name, (wall, cpu) in sorted(phases.items())}
@@ -1,20 +1,153 @@
+import codecs
+import io
+import itertools
+import locale
+import mmap
+import os
+import signal
 from pathlib import Path
-from .lexer import Lexer
+from typing import Iterable, Iterator, Tuple
+from .engines import create_lexer
+from .rules import Prefilter, select_rules
+from .statistics import FileMeasurement, Stopwatch
+from .violations import Violations
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
 
 
 class Verifier(object):
-    def __init__(self):
-        self.lexer = Lexer()
+    CHUNK_SIZE = 16
+    MMAP_THRESHOLD = 1024 * 1024
+    MMAP_CHUNK_SIZE = 256 * 1024
+
+    def __init__(self, jobs: int = 1, cache=None, statistics=None, rules: Iterable[str] = None, engine: str = 'ply',
+                 max_violations: int = None):
+        self.jobs = jobs
+        self.engine = engine
+        self.max_violations = max_violations
+        self.cache = cache
+        self.statistics = statistics
+        self.rules = select_rules(rules)
+        self.prefilter = Prefilter(self.rules)
+        self.lexer = None
+        self.pool = None
+
+    def open_pool(self) -> None:
+        if self.jobs > 1 and self.pool is None:
+            self.pool = self.__create_pool(self.jobs)
+
+    def close_pool(self) -> None:
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+    def check_path(self, files: Iterable[Path]) -> Iterator[Tuple[Path, Violations]]:
+        files = iter(files)
+        first_files = list(itertools.islice(files, self.jobs * self.CHUNK_SIZE if self.jobs > 1 else 0))
+        files = itertools.chain(first_files, files)
+
+        processes = min(self.jobs, -(-len(first_files) // self.CHUNK_SIZE))
+        if processes > 1:
+            results = self.__check_in_parallel(files, processes)
+        else:
+            results = ((file,) + self.measure_file(file) for file in files)
+
+        for file, violations, measurement in results:
+            if self.statistics is not None:
+                self.statistics.record_file(file, measurement)
+            yield file, violations
+
+    def check_file(self, file: Path) -> Violations:
+        return self.measure_file(file)[0]
+
+    def check_content(self, content) -> Violations:
+        if not isinstance(content, str):
+            return self.__validate_content(content)
+        if not self.prefilter.may_match(content):
+            return Violations()
+        return self.__find_issues([io.StringIO(content, newline=None).read()])
+
+    def measure_file(self, file: Path) -> Tuple[Violations, FileMeasurement]:
+        reading = Stopwatch()
+        lexing = Stopwatch()
+        with file.open('rb') as stream:
+            size = os.fstat(stream.fileno()).st_size
+            if size < self.MMAP_THRESHOLD:
+                with reading.measure():
+                    content = stream.read()
+                with lexing.measure():
+                    violations = self.__validate_content(content)
+            else:
+                with reading.measure():
+                    content = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+                with content, lexing.measure():
+                    violations = self.__validate_content(content)
+
+        return violations, FileMeasurement(size, reading.wall, reading.cpu,
+                                           lexing.wall, lexing.cpu, len(violations))
+
+    def __check_in_parallel(self, files: Iterator[Path],
+                            processes: int) -> Iterator[Tuple[Path, Violations, FileMeasurement]]:
+        if self.pool is not None:
+            yield from self.pool.imap(_check_file_in_worker, files, self.CHUNK_SIZE)
+            return
+        with self.__create_pool(processes) as pool:
+            yield from pool.imap(_check_file_in_worker, files, self.CHUNK_SIZE)
+
+    def __create_pool(self, processes: int):
+        from multiprocessing import Pool
+        return Pool(processes, initializer=_init_worker,
+                    initargs=(self.cache, self.rules, self.engine, self.max_violations))
+
+    def __validate_content(self, content) -> Violations:
+        if not self.prefilter.may_match(content):
+            return Violations()
+        if self.cache is None:
+            return self.__find_issues(self.__decode(content))
+
+        key = self.cache.key(content)
+        cached_violations = self.cache.get(key)
+        if cached_violations is not None:
+            return Violations.from_list_in_chunks(cached_violations, self.__decode(content))
+
+        violations = self.__find_issues(self.__decode(content))
+        if self.max_violations is None or len(violations) < self.max_violations:
+            self.cache.put(key, list(violations))
+        return violations
+
+    def __decode(self, content) -> Iterator[str]:
+        if len(content) < self.MMAP_THRESHOLD:
+            yield io.TextIOWrapper(io.BytesIO(content)).read()
+            return
+
+        decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))()
+        decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
+        remainder = ''
+        for start in range(0, len(content), self.MMAP_CHUNK_SIZE):
+            data = remainder + decoder.decode(content[start:start + self.MMAP_CHUNK_SIZE])
+            end = data.rfind('\n') + 1
+            if end:
+                yield data[:end]
+            remainder = data[end:]
+        yield remainder + decoder.decode(b'', final=True)
+
+    def __find_issues(self, chunks: Iterable[str]) -> Violations:
+        if self.lexer is None:
+            self.lexer = create_lexer(self.engine, self.rules)
+        return Violations.from_chunks(self.lexer.analyze_chunks(chunks), self.max_violations)
+
+
+_worker_verifier = None
+
 
-    def check_path(self, files: list) -> list:
-        files_with_issues = []
-        for file in files:
-            files_with_issues += [(file, self.__validate_file(file))]
-        return files_with_issues
+def _init_worker(cache, rules: frozenset, engine: str, max_violations: int) -> None:
+    global _worker_verifier
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    _worker_verifier = Verifier(cache=cache, rules=rules, engine=engine, max_violations=max_violations)
 
-    def __validate_file(self, file: Path) -> list:
-        with file.open() as cmake_file:
-            return self.__find_issues(cmake_file.read())
 
-    def __find_issues(self, data: str) -> list:
-        return [(issue.type, issue.lineno) for issue in self.lexer.analyze(data)]
+def _check_file_in_worker(file: Path) -> Tuple[Path, Violations, FileMeasurement]:
+    return (file,) + _worker_verifier.measure_file(file)
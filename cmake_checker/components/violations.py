@@ -0,0 +1,133 @@
+from array import array
+from collections import namedtuple
+from typing import Callable, Iterable, Iterator, Tuple
+
+from .rules import RULE_NAMES
+
+Violation = namedtuple('Violation', ['type', 'line'])
+
+_rule_names = list(RULE_NAMES)
+_rule_ids = {name: rule_id for rule_id, name in enumerate(_rule_names)}
+
+
+def rule_id(name: str) -> int:
+    if name not in _rule_ids:
+        _rule_names.append(name)
+        _rule_ids[name] = len(_rule_names) - 1
+    return _rule_ids[name]
+
+
+def rule_name(rule: int) -> str:
+    return _rule_names[rule]
+
+
+class Violations(object):
+    __slots__ = ('rule_ids', 'line_numbers', 'source_lines')
+
+    def __init__(self):
+        self.rule_ids = array('H')
+        self.line_numbers = array('I')
+        self.source_lines = {}
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable, data: str) -> 'Violations':
+        return cls.from_chunks([(data, tokens)])
+
+    @classmethod
+    def from_chunks(cls, chunks_with_tokens: Iterable[Tuple[str, Iterable]], limit: int = None) -> 'Violations':
+        violations = cls()
+        for data, tokens in chunks_with_tokens:
+            for token in tokens:
+                violations.append(token.type, token.lineno)
+                if token.lineno not in violations.source_lines:
+                    violations.source_lines[token.lineno] = line_at_position(data, token.lexpos)
+                if len(violations) == limit:
+                    return violations
+        return violations
+
+    @classmethod
+    def from_list(cls, violation_list: Iterable[Tuple[str, int]], data: str) -> 'Violations':
+        return cls.from_list_in_chunks(violation_list, [data])
+
+    @classmethod
+    def from_list_in_chunks(cls, violation_list: Iterable[Tuple[str, int]], chunks: Iterable[str]) -> 'Violations':
+        violations = cls()
+        for violation_type, line in violation_list:
+            violations.append(violation_type, line)
+        line_numbers = sorted(set(violations.line_numbers))
+
+        first_line_number = 1
+        for chunk in chunks:
+            if not line_numbers:
+                break
+            last_line_number = first_line_number + chunk.count('\n')
+            in_chunk = [line - first_line_number + 1 for line in line_numbers if line <= last_line_number]
+            for line, source_line in lines_with_numbers(chunk, in_chunk).items():
+                violations.source_lines[line + first_line_number - 1] = source_line
+            line_numbers = [line for line in line_numbers
+                            if line >= last_line_number and line not in violations.source_lines]
+            first_line_number = last_line_number
+        return violations
+
+    def append(self, violation_type: str, line: int) -> None:
+        self.rule_ids.append(rule_id(violation_type))
+        self.line_numbers.append(line)
+
+    def select(self, predicate: Callable[[str, int], bool]) -> 'Violations':
+        selected = Violations()
+        for rule, line in zip(self.rule_ids, self.line_numbers):
+            if predicate(_rule_names[rule], line):
+                selected.rule_ids.append(rule)
+                selected.line_numbers.append(line)
+                if line in self.source_lines:
+                    selected.source_lines[line] = self.source_lines[line]
+        return selected
+
+    def source_line(self, line_number: int) -> str:
+        return self.source_lines.get(line_number, '')
+
+    def __iter__(self) -> Iterator[Violation]:
+        return (Violation(_rule_names[rule], line) for rule, line in zip(self.rule_ids, self.line_numbers))
+
+    def __len__(self) -> int:
+        return len(self.rule_ids)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Violations):
+            return self.rule_ids == other.rule_ids and self.line_numbers == other.line_numbers
+        return list(self) == other
+
+    def __repr__(self) -> str:
+        return 'Violations(%r)' % list(self)
+
+
+class ViolationCounter(object):
+    def __init__(self):
+        self.count = 0
+
+    def counted(self, files_with_info: Iterable) -> Iterator:
+        for file, violations in files_with_info:
+            self.count = self.count + len(violations)
+            yield file, violations
+
+
+def line_at_position(data: str, position: int) -> str:
+    start = data.rfind('\n', 0, position) + 1
+    end = data.find('\n', position)
+    return data[start:] if end == -1 else data[start:end + 1]
+
+
+def lines_with_numbers(data: str, line_numbers: Iterable[int]) -> dict:
+    lines = {}
+    position = 0
+    current_line_number = 1
+    for line_number in sorted(set(line_numbers)):
+        while current_line_number < line_number and position != -1:
+            position = data.find('\n', position)
+            if position != -1:
+                position = position + 1
+                current_line_number = current_line_number + 1
+        if position == -1 or position == len(data):
+            break
+        lines[line_number] = line_at_position(data, position)
+    return lines
@@ -0,0 +1,194 @@
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import threading
+from typing import Callable, Iterable
+
+
+class Watcher(object):
+    def __init__(self, roots: Iterable[str], on_change: Callable[[str, bool], None]):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.on_change = on_change
+        self.thread = None
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self.run, name='cmake-checker-watcher', daemon=True)
+        self.thread.start()
+
+    def run(self) -> None:
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        raise NotImplementedError
+
+
+class PollingWatcher(Watcher):
+    def __init__(self, roots: Iterable[str], on_change: Callable[[str, bool], None], interval: float = 1.0):
+        super(PollingWatcher, self).__init__(roots, on_change)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.snapshot = self.__take_snapshot()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.poll()
+
+    def poll(self) -> None:
+        snapshot = self.__take_snapshot()
+        for path in sorted(snapshot.keys() | self.snapshot.keys()):
+            old_state, new_state = self.snapshot.get(path), snapshot.get(path)
+            if old_state != new_state:
+                self.on_change(path, old_state is None or new_state is None)
+        self.snapshot = snapshot
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def __take_snapshot(self) -> dict:
+        snapshot = {}
+        for root in self.roots:
+            if not os.path.isdir(root):
+                self.__add_to_snapshot(snapshot, root)
+                continue
+            for directory, _, files in os.walk(root):
+                for name in files:
+                    self.__add_to_snapshot(snapshot, os.path.join(directory, name))
+        return snapshot
+
+    @staticmethod
+    def __add_to_snapshot(snapshot: dict, path: str) -> None:
+        try:
+            status = os.stat(path)
+        except OSError:
+            return
+        snapshot[path] = (status.st_mtime_ns, status.st_size)
+
+
+class InotifyWatcher(Watcher):
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE \
+        | IN_DELETE_SELF | IN_MOVE_SELF
+    STRUCTURAL_CHANGES = IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    EVENT_HEADER = struct.Struct('iIII')
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, roots: Iterable[str], on_change: Callable[[str, bool], None]):
+        super(InotifyWatcher, self).__init__(roots, on_change)
+        self.libc = self.__load_libc()
+        self.descriptor = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.descriptor < 0:
+            self.__raise_errno()
+        self.watches = {}
+        self.stop_reader, self.stop_writer = os.pipe()
+        try:
+            for root in self.roots:
+                self.__watch_tree(root)
+        except OSError:
+            self.__close()
+            raise
+
+    def run(self) -> None:
+        try:
+            while True:
+                ready, _, _ = select.select([self.descriptor, self.stop_reader], [], [])
+                if self.stop_reader in ready:
+                    return
+                self.__handle_events(os.read(self.descriptor, self.READ_SIZE))
+        finally:
+            self.__close()
+
+    def stop(self) -> None:
+        try:
+            os.write(self.stop_writer, b'\0')
+        except OSError:
+            pass
+
+    def __handle_events(self, buffer: bytes) -> None:
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(buffer):
+            watch, mask, _, length = self.EVENT_HEADER.unpack_from(buffer, offset)
+            offset = offset + self.EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b'\0'))
+            offset = offset + length
+
+            if mask & self.IN_Q_OVERFLOW:
+                self.on_change(None, True)
+                continue
+            if mask & self.IN_IGNORED:
+                self.watches.pop(watch, None)
+                continue
+
+            directory = self.watches.get(watch)
+            if directory is None:
+                continue
+            path = os.path.join(directory, name) if name else directory
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self.__watch_new_directory(path)
+            self.on_change(path, bool(mask & self.STRUCTURAL_CHANGES))
+
+    def __watch_new_directory(self, path: str) -> None:
+        try:
+            self.__watch_tree(path)
+        except OSError:
+            self.on_change(None, True)
+
+    def __watch_tree(self, root: str) -> None:
+        self.__add_watch(root)
+        for directory, _, _ in os.walk(root):
+            if directory != root:
+                self.__add_watch(directory)
+
+    def __add_watch(self, path: str) -> None:
+        watch = self.libc.inotify_add_watch(self.descriptor, os.fsencode(path), self.WATCH_MASK)
+        if watch < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.EACCES, errno.ENOTDIR):
+                return
+            self.__raise_errno(error)
+        self.watches[watch] = path
+
+    def __close(self) -> None:
+        for descriptor in (self.descriptor, self.stop_reader, self.stop_writer):
+            try:
+                os.close(descriptor)
+            except OSError:
+                pass
+
+    @staticmethod
+    def __load_libc() -> ctypes.CDLL:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+
+    @staticmethod
+    def __raise_errno(error: int = None) -> None:
+        error = ctypes.get_errno() if error is None else error
+        raise OSError(error, os.strerror(error))
+
+
+def create_watcher(roots: Iterable[str], on_change: Callable[[str, bool], None], kind: str = 'auto',
+                   interval: float = 1.0) -> Watcher:
+    roots = list(roots)
+    if kind in ('auto', 'inotify'):
+        try:
+            return InotifyWatcher(roots, on_change)
+        except (OSError, AttributeError, TypeError):
+            if kind == 'inotify':
+                raise
+    return PollingWatcher(roots, on_change, interval)
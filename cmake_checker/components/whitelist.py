@@ -0,0 +1,65 @@
+import itertools
+import posixpath
+import re
+from typing import Iterable
+
+from pathspec import PathSpec, util
+
+
+class WhitelistMatcher(object):
+    WHOLE_SUBTREE_SUFFIXES = ('(?:/.*)?$', '/.*$')
+    NAMED_GROUP = re.compile(r'\(\?P<\w+>')
+
+    def __init__(self, whitelist: Iterable[str] = None):
+        patterns = PathSpec.from_lines('gitwildmatch', whitelist or []).patterns
+        self.patterns = [pattern for pattern in patterns if pattern.include is not None]
+        self.runs = self.__compile_runs()
+        self.ignored_directories = self.__compile_ignored_directories()
+        self.directory_results = {}
+
+    def match_file(self, file: str) -> bool:
+        normalized_file = util.normalize_file(file)
+        if self.ignored_directories is not None and self.__is_directory_ignored(posixpath.dirname(normalized_file)):
+            return True
+        for include, regex in self.runs:
+            if regex.match(normalized_file) is not None:
+                return include
+        return False
+
+    def match_directory(self, directory: str) -> bool:
+        if self.ignored_directories is None:
+            return False
+        return self.__is_directory_ignored(util.normalize_file(directory))
+
+    def __is_directory_ignored(self, directory: str) -> bool:
+        result = self.directory_results.get(directory)
+        if result is None:
+            parent = posixpath.dirname(directory)
+            result = bool(directory) and not directory.endswith('/') \
+                and self.ignored_directories.fullmatch(directory) is not None \
+                or parent != directory and self.__is_directory_ignored(parent)
+            self.directory_results[directory] = result
+        return result
+
+    def __compile_runs(self) -> list:
+        runs = []
+        for include, patterns in itertools.groupby(self.patterns, key=lambda pattern: pattern.include):
+            runs.append((include, self.__combine(pattern.regex.pattern for pattern in patterns)))
+        return list(reversed(runs))
+
+    def __compile_ignored_directories(self):
+        if any(not pattern.include for pattern in self.patterns):
+            return None
+
+        prefixes = []
+        for pattern in self.patterns:
+            regex = pattern.regex.pattern
+            for suffix in self.WHOLE_SUBTREE_SUFFIXES:
+                if regex.endswith(suffix):
+                    prefixes.append(regex[:-len(suffix)])
+                    break
+        return self.__combine(prefixes) if prefixes else None
+
+    @classmethod
+    def __combine(cls, regexes: Iterable[str]):
+        return re.compile('|'.join('(?:%s)' % cls.NAMED_GROUP.sub('(?:', regex) for regex in regexes))
@@ -0,0 +1,51 @@
+import io
+import os
+import tempfile
+from unittest import TestCase
+from pathlib import Path
+
+from cmake_checker.components.baseline import Baseline, BaselineError
+from cmake_checker.components.violations import Violations
+
+
+class TestBaseline(TestCase):
+    def create_baseline(self, files_with_info: list) -> Baseline:
+        baseline = Baseline()
+        list(baseline.record(files_with_info))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'baseline.json'
+            baseline.write(path)
+            with path.open() as baseline_file:
+                return Baseline.load(baseline_file)
+
+    def test_should_not_report_violations_moved_to_other_lines(self):
+        baseline = self.create_baseline([(Path('CMakeLists.txt'),
+                                          Violations.from_list([('FILE_GLOB', 1)], 'file(GLOB x)\n'))])
+        shifted = Violations.from_list([('FILE_GLOB', 3), ('FILE_GLOB', 4)], '\n\n  file(GLOB   x)\nfile(GLOB y)\n')
+
+        [(_, new_violations)] = baseline.select_new_violations([(Path('CMakeLists.txt'), shifted)])
+
+        self.assertEqual([('FILE_GLOB', 4)], new_violations)
+
+    def test_should_count_repeated_violations(self):
+        violations = Violations.from_list([('FILE_GLOB', 1)], 'file(GLOB x)\n')
+        baseline = self.create_baseline([(Path('CMakeLists.txt'), violations)])
+        repeated = Violations.from_list([('FILE_GLOB', 1), ('FILE_GLOB', 2)], 'file(GLOB x)\nfile(GLOB x)\n')
+
+        [(_, new_violations)] = baseline.select_new_violations([(Path('CMakeLists.txt'), repeated)])
+
+        self.assertEqual([('FILE_GLOB', 2)], new_violations)
+
+    def test_should_distinguish_files_and_identify_them_relative_to_working_directory(self):
+        violations = Violations.from_list([('FILE_GLOB', 1)], 'file(GLOB x)\n')
+        baseline = self.create_baseline([(Path('a/CMakeLists.txt'), violations)])
+
+        results = baseline.select_new_violations([(Path(os.path.abspath('a/CMakeLists.txt')), violations),
+                                                  (Path('b/CMakeLists.txt'), violations)])
+
+        self.assertEqual([0, 1], [len(new_violations) for _, new_violations in results])
+
+    def test_should_reject_invalid_baseline(self):
+        for content in ('not json', '{"version": 99, "violations": []}', '{"version": 1}'):
+            with self.assertRaises(BaselineError):
+                Baseline.load(io.StringIO(content))
@@ -0,0 +1,82 @@
+import os
+import tempfile
+from unittest import TestCase
+from pathlib import Path
+
+from cmake_checker.components.cache import ResultCache
+from cmake_checker.components.verifier import Verifier
+
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(Path(self.directory.name))
+        super(TestResultCache, self).setUp()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super(TestResultCache, self).tearDown()
+
+    def test_should_return_none_for_unknown_content(self):
+        self.assertIsNone(self.cache.get(self.cache.key(b'file(GLOB')))
+
+    def test_should_return_stored_violations_for_same_content(self):
+        key = self.cache.key(b'file(GLOB')
+        self.cache.put(key, [('FILE_GLOB', 1)])
+
+        self.assertEqual([('FILE_GLOB', 1)], self.cache.get(key))
+
+    def test_should_not_share_entries_between_tool_versions_or_rule_sets(self):
+        key = self.cache.key(b'file(GLOB')
+        self.cache.put(key, [('FILE_GLOB', 1)])
+
+        other_cache = ResultCache(Path(self.directory.name))
+        other_cache.namespace = 'other'
+
+        self.assertIsNone(other_cache.get(key))
+
+    def test_cleanup_should_remove_oldest_entries_when_cache_is_too_big(self):
+        old_key = self.cache.key(b'old')
+        new_key = self.cache.key(b'new')
+        self.cache.put(old_key, [('FILE_GLOB', 1)])
+        self.cache.put(new_key, [('FILE_GLOB', 2)])
+        old_entry = Path(self.directory.name, self.cache.namespace, old_key[:2], old_key)
+        os.utime(str(old_entry), (0, 0))
+
+        self.cache.max_size = old_entry.stat().st_size
+        self.cache.cleanup()
+
+        self.assertIsNone(self.cache.get(old_key))
+        self.assertEqual([('FILE_GLOB', 2)], self.cache.get(new_key))
+
+    def test_cleanup_should_keep_files_not_created_by_cache(self):
+        key = self.cache.key(b'old')
+        self.cache.put(key, [('FILE_GLOB', 1)])
+        entry = Path(self.directory.name, self.cache.namespace, key[:2], key)
+        stale_temporary = entry.with_name('.tmp-stale')
+        stale_temporary.write_text('[')
+        foreign_files = [Path(self.directory.name, 'other', 'notes.txt'),
+                         Path(self.directory.name, self.cache.namespace, 'notes.txt'),
+                         entry.with_name('ff' + key[2:]),
+                         entry.with_name(key + '.bak')]
+        for foreign_file in foreign_files:
+            foreign_file.parent.mkdir(parents=True, exist_ok=True)
+            foreign_file.write_text('keep me')
+        for path in foreign_files + [entry, stale_temporary]:
+            os.utime(str(path), (0, 0))
+
+        self.cache.cleanup()
+
+        self.assertFalse(entry.exists())
+        self.assertFalse(stale_temporary.exists())
+        for foreign_file in foreign_files:
+            self.assertEqual('keep me', foreign_file.read_text())
+
+    def test_verifier_should_reuse_cached_results_for_unchanged_files(self):
+        cmake_file = Path(self.directory.name, 'CMakeLists.txt')
+        cmake_file.write_text('\nfile(GLOB')
+        verifier = Verifier(cache=self.cache)
+
+        self.assertEqual([('FILE_GLOB', 2)], verifier.check_file(cmake_file))
+        self.cache.put(self.cache.key(cmake_file.read_bytes()), [('ADD_DEFINITIONS', 7)])
+        self.assertEqual([('ADD_DEFINITIONS', 7)], verifier.check_file(cmake_file))
@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import TestCase
+
+from benchmarks.corpus import CMakeGenerator
+from cmake_checker.api import Checker, Violation
+from cmake_checker.components.verifier import Verifier
+
+
+class TestChecker(TestCase):
+    PATH = Path('cmake_checker/tests/integration_tests')
+
+    def test_should_check_bytes_and_text_buffers_like_files(self):
+        files = sorted(self.PATH.glob('**/CMakeLists.txt'))
+        checker = Checker()
+
+        from_bytes = list(checker.check((str(file), file.read_bytes()) for file in files))
+        from_text = list(checker.check((str(file), file.read_text()) for file in files))
+
+        expected = [(str(file), Verifier().check_file(file)) for file in files]
+        self.assertEqual(expected, from_bytes)
+        self.assertEqual(expected, from_text)
+
+    def test_should_load_buffers_with_given_loader(self):
+        contents = {'a.cmake': 'file(GLOB x)\r\n\r\nadd_definitions(-DX)\r\n', 'b.cmake': b'project(b)\n'}
+
+        results = dict(Checker().check(sorted(contents), loader=contents.get))
+
+        self.assertEqual([Violation('FILE_GLOB', 1), Violation('ADD_DEFINITIONS', 3)], list(results['a.cmake']))
+        self.assertEqual('add_definitions(-DX)\n', results['a.cmake'].source_line(3))
+        self.assertFalse(results['b.cmake'])
+
+    def test_should_check_only_selected_rules(self):
+        violations = Checker(rules=['ADD_DEFINITIONS']).check_buffer('file(GLOB x)\nadd_definitions(-DX)\n')
+
+        self.assertEqual([('ADD_DEFINITIONS', 2)], violations)
+
+    def test_should_reject_unknown_rules_and_engines(self):
+        with self.assertRaisesRegex(ValueError, 'FILE_GLOBS'):
+            Checker(rules=['FILE_GLOB', 'FILE_GLOBS'])
+        with self.assertRaisesRegex(ValueError, 'faster'):
+            Checker(engine='faster')
+
+    def test_should_give_the_same_results_when_shared_between_threads(self):
+        generator = CMakeGenerator(seed=3)
+        buffers = [('file_%d' % index, generator.file_content(8)) for index in range(200)]
+
+        for engine in ('ply', 'fast'):
+            checker = Checker(engine=engine)
+            expected = list(checker.check(buffers))
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda buffer: (buffer[0], checker.check_buffer(buffer[1])), buffers))
+
+            self.assertEqual(expected, results)
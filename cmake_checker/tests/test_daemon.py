@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+from pathlib import Path
+
+from cmake_checker.components.client import DaemonError, request_check
+from cmake_checker.components.daemon import CheckServer
+from cmake_checker.components.file_finder import provide_files_for_verification
+from cmake_checker.components.reporter import Reporter
+from cmake_checker.components.verifier import Verifier
+
+
+class TestCheckServer(TestCase):
+    PATH = Path('cmake_checker/tests/integration_tests')
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.root = Path(self.directory) / 'tree'
+        shutil.copytree(str(self.PATH), str(self.root))
+        self.socket_path = os.path.join(self.directory, 'server.sock')
+        self.server = CheckServer(self.socket_path, [self.root], watcher='polling', poll_interval=60)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        super(TestCheckServer, self).setUp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+        super(TestCheckServer, self).tearDown()
+
+    def request(self, path: Path) -> dict:
+        return request_check(self.socket_path, {'cwd': os.getcwd(), 'paths': [str(path)], 'whitelist': None})
+
+    def expected_output(self, path: Path) -> str:
+        files_with_info = Verifier().check_path(provide_files_for_verification([path], None))
+        return Reporter.create('console', files_with_info).generate_report()
+
+    def test_should_answer_with_the_same_output_as_console_reporter(self):
+        response = self.request(self.root)
+
+        self.assertEqual(self.expected_output(self.root), response['output'])
+        self.assertEqual(9, response['violation_count'])
+
+    def test_should_check_again_files_changed_since_last_request(self):
+        self.request(self.root)
+        cmake_file = self.root / 'empty_file/CMakeLists.txt'
+        cmake_file.write_text('\nfile(GLOB SOURCES *.cpp)\n')
+        new_file = self.root / 'empty_file/new.cmake'
+        new_file.write_text('add_definitions(-DFOO)\n')
+        self.server.watcher.poll()
+
+        response = self.request(self.root)
+
+        self.assertEqual(self.expected_output(self.root), response['output'])
+        self.assertIn('>>>%s<<<\nline:    2            FILE_GLOB>' % cmake_file, response['output'])
+        self.assertIn('>>>%s<<<\nline:    1      ADD_DEFINITIONS>' % new_file, response['output'])
+        self.assertEqual(11, response['violation_count'])
+
+    def test_should_resolve_project_graph_on_request(self):
+        (self.root / 'empty_file/CMakeLists.txt').write_text('function(f)\n  include(scope.cmake)\nendfunction()\n')
+        scope_file = self.root / 'empty_file/scope.cmake'
+        scope_file.write_text('set(x 1 PARENT_SCOPE)\n')
+        request = {'cwd': os.getcwd(), 'paths': [str(self.root)], 'whitelist': None}
+
+        self.assertIn('>>>%s<<<' % scope_file, request_check(self.socket_path, request)['output'])
+        request['project_graph'] = True
+        self.assertNotIn('>>>%s<<<' % scope_file, request_check(self.socket_path, request)['output'])
+
+    def test_should_report_errors_to_client(self):
+        with self.assertRaises(DaemonError):
+            self.request(self.root / 'not_existing.cmake')
@@ -0,0 +1,68 @@
+import os
+from unittest import TestCase
+from pathlib import Path
+
+from cmake_checker.components.diff_filter import DiffFilter
+from cmake_checker.components.violations import Violations
+
+
+class TestDiffFilter(TestCase):
+    DIFF = """diff --git a/src/CMakeLists.txt b/src/CMakeLists.txt
+index 1111111..2222222 100644
+--- a/src/CMakeLists.txt
++++ b/src/CMakeLists.txt
+@@ -1,4 +1,5 @@
+ project(a)
+-add_definitions(-DOLD)
++add_definitions(-DNEW)
++-- not a header
+ file(GLOB x)
+ 
+@@ -10 +11,0 @@
+-removed line
+diff --git a/removed.cmake b/removed.cmake
+deleted file mode 100644
+--- a/removed.cmake
++++ /dev/null
+@@ -1 +0,0 @@
+-file(GLOB x)
+diff --git a/only_removals.cmake b/only_removals.cmake
+--- a/only_removals.cmake
++++ b/only_removals.cmake
+@@ -3,2 +3 @@
+-include_directories(a)
+ set(A 1)
+""".splitlines(keepends=True)
+
+    def test_should_select_only_files_with_added_lines(self):
+        diff_filter = DiffFilter.from_unified_diff(self.DIFF)
+        files = [Path('src/CMakeLists.txt'), Path('removed.cmake'), Path('only_removals.cmake'), Path('other.cmake')]
+
+        self.assertEqual([Path('src/CMakeLists.txt')], list(diff_filter.select_files(files)))
+
+    def test_should_keep_only_violations_on_added_lines(self):
+        diff_filter = DiffFilter.from_unified_diff(self.DIFF)
+        violations = Violations.from_list([('ADD_DEFINITIONS', 2), ('FILE_GLOB', 4)],
+                                          "project(a)\nadd_definitions(-DNEW)\n-- not a header\nfile(GLOB x)\n")
+
+        (file, selected), = diff_filter.select_violations([(Path('./src/CMakeLists.txt'), violations)])
+
+        self.assertEqual([('ADD_DEFINITIONS', 2)], selected)
+        self.assertEqual("add_definitions(-DNEW)\n", selected.source_line(2))
+
+    def test_should_resolve_file_names_with_given_strip_level_and_root(self):
+        diff = [line.replace('a/', '', 1).replace('b/', '', 1) for line in self.DIFF]
+        diff_filter = DiffFilter.from_unified_diff(diff, strip=0, root=Path('/repository'))
+        files = [Path('/repository/src/CMakeLists.txt'), Path('src/CMakeLists.txt')]
+
+        self.assertEqual([Path('/repository/src/CMakeLists.txt')], list(diff_filter.select_files(files)))
+
+    def test_should_list_changed_cmake_files_which_were_not_checked(self):
+        diff = self.DIFF + ['+++ b/README.md\n', '@@ -1 +1 @@\n', '+text\n']
+        diff_filter = DiffFilter.from_unified_diff(diff)
+
+        list(diff_filter.select_files([Path('other.cmake')]))
+
+        self.assertEqual([os.path.abspath('src/CMakeLists.txt')], diff_filter.unchecked_files())
+        list(diff_filter.select_files([Path('src/CMakeLists.txt')]))
+        self.assertEqual([], diff_filter.unchecked_files())
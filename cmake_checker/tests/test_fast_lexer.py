@@ -0,0 +1,64 @@
+import random
+from pathlib import Path
+from unittest import TestCase
+
+from benchmarks.corpus import PROFILES, CMakeGenerator
+from cmake_checker.components.fast_lexer import FastLexer
+from cmake_checker.components.lexer import Lexer
+from cmake_checker.components.rules import RULE_NAMES
+from cmake_checker.tests import test_lexer
+
+
+class TestFastLexer(test_lexer.TestLexer):
+    def setUp(self):
+        super(TestFastLexer, self).setUp()
+        self.lexer = FastLexer()
+
+
+class TestFastLexerAgainstPly(TestCase):
+    PATH = Path('cmake_checker/tests/integration_tests')
+    FRAGMENTS = ['\n', '\n\n', ' ', '\t', '#', '\\#', '[', ']', '=', '(', ')', 'x', '../..', 'set(', 'function(',
+                 'endfunction(', 'endfunction()', 'endfunction( )', ' PARENT_SCOPE', ' CACHE', 'ENV{',
+                 'target_sources(', 'cmake-check disable', 'cmake-check enable', 'file(GLOB', 'include_directories(',
+                 ' link_libraries(', 'endif(x)', 'CMAKE_CXX_FLAGS', '#[[', ']]', '#[=[', ']=]']
+
+    @staticmethod
+    def tokens(lexer, data: str) -> list:
+        return [(token.type, token.lineno, token.lexpos) for token in lexer.analyze(data)]
+
+    def assert_same_tokens(self, contents: list, rules: list = None) -> None:
+        ply_lexer, fast_lexer = Lexer(rules), FastLexer(rules)
+        for content in contents:
+            self.assertEqual(self.tokens(ply_lexer, content), self.tokens(fast_lexer, content), content)
+
+    def test_should_find_the_same_tokens_in_test_files(self):
+        files = [file for file in self.PATH.glob('**/*') if file.suffix in ('.txt', '.cmake')]
+
+        self.assertTrue(files)
+        self.assert_same_tokens([file.read_text() for file in files])
+
+    def test_should_find_the_same_tokens_in_benchmark_corpus(self):
+        generator = CMakeGenerator(seed=0)
+        contents = [generator.file_content(profile.blocks_per_file) for profile in PROFILES.values()]
+
+        self.assert_same_tokens(contents)
+        self.assert_same_tokens(contents, ['PARENT_SCOPE', 'ENDFUNCTION', 'COMPILE_FLAGS'])
+
+    def test_should_find_the_same_tokens_in_random_fragments(self):
+        generator = random.Random(0)
+        contents = [''.join(generator.choice(self.FRAGMENTS) for _ in range(generator.randint(0, 60)))
+                    for _ in range(500)]
+
+        self.assert_same_tokens(contents)
+        self.assert_same_tokens(contents, generator.sample(RULE_NAMES, 5))
+
+    def test_chunks_should_give_the_same_tokens(self):
+        content = CMakeGenerator(seed=1).file_content(50)
+        lines = content.splitlines(True)
+        chunks = [''.join(lines[start:start + 7]) for start in range(0, len(lines), 7)]
+
+        def chunk_tokens(lexer) -> list:
+            return [(token.type, token.lineno, token.lexpos) for _, tokens in lexer.analyze_chunks(chunks)
+                    for token in tokens]
+
+        self.assertEqual(chunk_tokens(Lexer()), chunk_tokens(FastLexer()))
@@ -1,7 +1,11 @@
-from unittest import TestCase
+import itertools
+import os
+import tempfile
+import time
+from unittest import TestCase, mock
 from pathlib import Path
 
-from cmake_checker.components.file_finder import FileFinder
+from cmake_checker.components.file_finder import FileFinder, discover_in_background
 
 
 class TestFileFinder(TestCase):
@@ -21,3 +25,70 @@ class TestFileFinder(TestCase):
         self.assertEqual(3, len(all_found_files))
         self.assertTrue(all(not str(x).endswith('.cmake') for x in all_found_files))
         self.assertTrue(all('empty_file' not in str(x) for x in all_found_files))
+
+    def test_should_list_files_sorted_with_cmake_scripts_before_cmake_lists(self):
+        file_finder = FileFinder()
+
+        all_found_files = file_finder.get_all_cmake_files(self.PATH / 'cmake-files-dir')
+
+        self.assertEqual([self.PATH / 'cmake-files-dir/some_folder/script.cmake',
+                          self.PATH / 'cmake-files-dir/CMakeLists.txt'], all_found_files)
+
+    def test_should_not_descend_into_whitelisted_directories(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            for folder in ['src', 'build/nested']:
+                (root / folder).mkdir(parents=True)
+                (root / folder / 'CMakeLists.txt').write_text('')
+
+            with mock.patch('cmake_checker.components.file_finder.os.scandir', wraps=os.scandir) as scandir:
+                all_found_files = FileFinder(['build/']).get_all_cmake_files(root)
+
+            self.assertEqual([root / 'src/CMakeLists.txt'], all_found_files)
+            self.assertNotIn(str(root / 'build'), [call[0][0] for call in scandir.call_args_list])
+
+    def test_should_list_only_changed_cmake_files_in_the_same_order_as_whole_directory(self):
+        changed_files = [self.PATH / 'non-cmake-files-dir/some_text_file.txt',
+                         self.PATH / 'empty_file/CMakeLists.txt',
+                         Path('README.md'),
+                         self.PATH / 'cmake-files-dir/CMakeLists.txt',
+                         self.PATH / 'cmake-files-dir/some_folder/script.cmake']
+        file_finder = FileFinder(['**/empty_file/**'])
+
+        all_found_files = list(file_finder.iterate_changed_cmake_files(Path('./' + str(self.PATH)), changed_files))
+
+        self.assertEqual([self.PATH / 'cmake-files-dir/some_folder/script.cmake',
+                          self.PATH / 'cmake-files-dir/CMakeLists.txt'], all_found_files)
+
+
+class TestDiscoverInBackground(TestCase):
+    def test_should_keep_order_of_discovered_files(self):
+        files = [Path('file%d.cmake' % number) for number in range(100)]
+
+        self.assertEqual(files, list(discover_in_background(iter(files), queue_size=3)))
+
+    def test_should_not_discover_more_than_queue_size_ahead(self):
+        discovered = []
+
+        def files():
+            for number in itertools.count():
+                discovered.append(number)
+                yield Path('file%d.cmake' % number)
+
+        background_files = discover_in_background(files(), queue_size=2)
+        self.assertEqual(Path('file0.cmake'), next(background_files))
+        time.sleep(0.2)
+        background_files.close()
+
+        self.assertLessEqual(len(discovered), 5)
+
+    def test_should_raise_discovery_errors_in_consumer(self):
+        def files():
+            yield Path('file.cmake')
+            raise PermissionError('denied')
+
+        background_files = discover_in_background(files())
+
+        self.assertEqual(Path('file.cmake'), next(background_files))
+        with self.assertRaises(PermissionError):
+            next(background_files)
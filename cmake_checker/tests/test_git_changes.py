@@ -0,0 +1,55 @@
+import os
+import subprocess
+import tempfile
+from unittest import TestCase
+from pathlib import Path
+
+from cmake_checker.components.file_finder import provide_changed_files_for_verification
+from cmake_checker.components.git_changes import list_changed_files, GitChangesError
+
+
+class TestGitChanges(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(os.path.realpath(self.directory.name))
+        self.git('init', '-q')
+        (self.root / 'CMakeLists.txt').write_text('project(a)\n')
+        (self.root / 'unchanged.cmake').write_text('\n')
+        (self.root / 'removed.cmake').write_text('\n')
+        self.git('add', '.')
+        self.git('-c', 'user.name=test', '-c', 'user.email=test@test', 'commit', '-q', '-m', 'initial')
+        super(TestGitChanges, self).setUp()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super(TestGitChanges, self).tearDown()
+
+    def git(self, *arguments):
+        subprocess.check_call(['git'] + list(arguments), cwd=self.directory.name)
+
+    def test_should_list_modified_and_untracked_files_but_not_removed_ones(self):
+        (self.root / 'CMakeLists.txt').write_text('project(b)\n')
+        (self.root / 'removed.cmake').unlink()
+        (self.root / 'new.cmake').write_text('\n')
+
+        changed_files = list_changed_files('HEAD', [self.root])
+
+        self.assertEqual([self.root / 'CMakeLists.txt', self.root / 'new.cmake'], changed_files)
+
+    def test_should_raise_error_for_unknown_reference(self):
+        self.assertRaises(GitChangesError, list_changed_files, 'not-existing-ref', [self.root])
+
+    def test_should_list_changes_outside_of_current_directory(self):
+        (self.root / 'sub').mkdir()
+        (self.root / 'sub/new.cmake').write_text('\n')
+        (self.root / 'CMakeLists.txt').write_text('project(b)\n')
+        (self.root / 'new.cmake').write_text('\n')
+        current_directory = os.getcwd()
+        os.chdir(str(self.root / 'sub'))
+        try:
+            changed_files = list_changed_files('HEAD', [Path('..')])
+            files = list(provide_changed_files_for_verification([Path('..')], None, changed_files))
+        finally:
+            os.chdir(current_directory)
+
+        self.assertEqual([Path('../new.cmake'), Path('../sub/new.cmake'), Path('../CMakeLists.txt')], files)
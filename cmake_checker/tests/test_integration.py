@@ -1,3 +1,5 @@
+import os
+import tempfile
 from unittest import TestCase
 from pathlib import Path
 import subprocess
@@ -106,6 +108,44 @@ class IntegrationTests(TestCase):
         self.assertEqual(command_line_output, output_file.read_text())
         output_file.unlink()
 
+    def test_parallel_verification_output_should_be_the_same_as_serial_one(self):
+        serial_output = self.__run_cmake_checker_for_file(self.INTEGRATION_TESTS_PATH, '--jobs', '1')
+        parallel_output = self.__run_cmake_checker_for_file(self.INTEGRATION_TESTS_PATH, '--jobs', '4')
+
+        self.assertEqual(serial_output, parallel_output)
+
+    def test_should_report_only_violations_on_lines_added_in_diff(self):
+        diff = ("--- a/{0}\n+++ b/{0}\n@@ -2,0 +3 @@\n+file(GLOB is here 444)\n"
+                .format(self.path('dir_with_file_glob_issue/CMakeLists.txt')))
+        execute_command = ['python3', '-m', self.PROGRAM, '--diff', '-', self.INTEGRATION_TESTS_PATH]
+
+        output = subprocess.run(execute_command, input=diff.encode(), stdout=subprocess.PIPE).stdout.decode()
+
+        self.assertNumberOfScannedFiles(1, output)
+        self.assertCheckerFoundNumberOfIssues(1, output)
+        self.assertIn("line:    3            FILE_GLOB> file(GLOB is here 444)", output)
+
+    def test_should_fail_when_files_changed_in_diff_do_not_exist(self):
+        diff = ("--- {0}\n+++ {0}\n@@ -2,0 +3 @@\n+file(GLOB is here 444)\n"
+                .format(self.path('dir_with_file_glob_issue/CMakeLists.txt')))
+        execute_command = ['python3', '-m', self.PROGRAM, '--diff', '-', self.INTEGRATION_TESTS_PATH]
+
+        result = subprocess.run(execute_command, input=diff.encode(), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        fixed = subprocess.run(execute_command + ['--diff-strip', '0'], input=diff.encode(), stdout=subprocess.PIPE)
+
+        self.assertNotEqual(0, result.returncode)
+        self.assertIn('--diff-strip', result.stderr.decode('utf-8'))
+        self.assertCheckerFoundNumberOfIssues(1, fixed.stdout.decode('utf-8'))
+
+    def test_server_client_should_reject_options_applied_only_to_local_checks(self):
+        for option in (['--jobs', '2'], ['--engine', 'fast']):
+            execute_command = ['python3', '-m', self.PROGRAM, '--server', 'socket', self.INTEGRATION_TESTS_PATH]
+
+            result = subprocess.run(execute_command + option, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+            self.assertEqual(2, result.returncode)
+            self.assertIn('--server can not be used together with %s' % option[0], result.stderr.decode('utf-8'))
+
     def test_junit_report_compare_with_golden_master_for_empty_directory(self):
         output = self.__run_cmake_checker_for_file(self.path('empty_dir'), '--reporter', 'junit')
         golden_master = Path(self.path('junit_goldenmaster/empty_dir.xml'))
@@ -128,3 +168,68 @@ class IntegrationTests(TestCase):
 
         self.assertNumberOfScannedFiles(2, output)
         self.assertCheckerFoundNumberOfIssues(3, output)
+
+    def test_merged_shards_should_give_the_same_report_and_exit_code_as_single_run(self):
+        with tempfile.TemporaryDirectory() as directory:
+            partials = [str(Path(directory, 'shard_%d.ndjson' % index)) for index in range(1, 4)]
+            shards = [subprocess.Popen(['python3', '-m', self.PROGRAM, self.INTEGRATION_TESTS_PATH, '--shard',
+                                        '%d/3' % index, '--reporter', 'partial', '-o', partial])
+                      for index, partial in enumerate(partials, 1)]
+            for shard in shards:
+                shard.wait()
+
+            merge = subprocess.run(['python3', '-m', self.PROGRAM, 'merge', '--reporter', 'junit'] + partials,
+                                   stdout=subprocess.PIPE)
+            single = subprocess.run(['python3', '-m', self.PROGRAM, self.INTEGRATION_TESTS_PATH,
+                                     '--reporter', 'junit'], stdout=subprocess.PIPE)
+
+        self.assertEqual(single.stdout.decode('utf-8'), merge.stdout.decode('utf-8'))
+        self.assertEqual(single.returncode, merge.returncode)
+        self.assertNotEqual(0, merge.returncode)
+
+    def test_checking_file_without_violations_should_not_import_optional_modules(self):
+        script = ('import runpy, sys\n'
+                  'sys.argv = ["cmake_checker", %r]\n'
+                  'try:\n'
+                  '    runpy.run_module("cmake_checker", run_name="__main__")\n'
+                  'except SystemExit:\n'
+                  '    pass\n'
+                  'sys.stderr.write(" ".join(sys.modules))\n' % self.path('empty_file/CMakeLists.txt'))
+        modules = subprocess.run(['python3', '-c', script], stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE).stderr.decode('utf-8').split()
+
+        for module in ('ply.lex', 'pathspec', 'multiprocessing', 'socket', 'ctypes', 'configparser', 'tempfile',
+                       'cmake_checker.components.lexer', 'cmake_checker.components.daemon'):
+            self.assertNotIn(module, modules)
+        self.assertIn('cmake_checker.components.verifier', modules)
+
+    def test_merge_and_server_client_should_not_import_verifier(self):
+        for arguments in (['merge', os.devnull], ['--server', os.devnull, self.INTEGRATION_TESTS_PATH]):
+            script = ('import runpy, sys\n'
+                      'sys.argv = ["cmake_checker"] + %r\n'
+                      'try:\n'
+                      '    runpy.run_module("cmake_checker", run_name="__main__")\n'
+                      'except SystemExit:\n'
+                      '    pass\n'
+                      'sys.stdout.write(" ".join(sys.modules))\n' % arguments)
+            modules = subprocess.run(['python3', '-c', script], stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE).stdout.decode('utf-8').split()
+
+            for module in ('mmap', 'cmake_checker.components.verifier', 'cmake_checker.components.checker',
+                           'cmake_checker.components.daemon'):
+                self.assertNotIn(module, modules)
+
+    def test_should_stop_with_failure_and_report_violations_found_until_max_violations(self):
+        for jobs in ('1', '4'):
+            result = subprocess.run(['python3', '-m', self.PROGRAM, self.INTEGRATION_TESTS_PATH, '--max-violations',
+                                     '2', '--jobs', jobs], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            output = result.stdout.decode('utf-8')
+
+            self.assertNotEqual(0, result.returncode)
+            self.assertCheckerFoundNumberOfIssues(2, output)
+            self.assertIn("Stopped after finding 2 violation(s).", result.stderr.decode('utf-8'))
+
+    def test_fail_fast_should_stop_at_first_violation(self):
+        output = self.__run_cmake_checker_for_file(self.INTEGRATION_TESTS_PATH, '--fail-fast')
+
+        self.assertCheckerFoundNumberOfIssues(1, output)
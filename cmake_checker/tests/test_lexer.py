@@ -1,4 +1,7 @@
+import tempfile
 from unittest import TestCase
+from pathlib import Path
+
 from cmake_checker.components.lexer import Lexer
 
 
@@ -151,3 +154,42 @@ class TestLexer(TestCase):
         self.assertEqual(1, len(tokens_found))
         self.assertEqual('FILE_GLOB', tokens_found[0].type)
         self.assertEqual(7, tokens_found[0].lineno)
+
+    def test_should_not_carry_state_over_to_next_analyzed_data(self):
+        self.lexer.analyze("set(SOME_VAR # unfinished comment")
+        tokens_found = self.lexer.analyze("file(GLOB")
+
+        self.assertEqual(1, len(tokens_found))
+        self.assertEqual('FILE_GLOB', tokens_found[0].type)
+
+
+class TestLexerTables(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.tables_file = Path(self.directory.name, Lexer.TABLES_MODULE + '.py')
+        super(TestLexerTables, self).setUp()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super(TestLexerTables, self).tearDown()
+
+    def create_lexer(self) -> Lexer:
+        class TemporaryTablesLexer(Lexer):
+            TABLES_DIRECTORY = self.directory.name
+        return TemporaryTablesLexer()
+
+    def test_should_write_tables_on_first_use_and_load_them_afterwards(self):
+        self.assertFalse(self.create_lexer().lexer.lexoptimize)
+        self.assertTrue(self.tables_file.exists())
+
+        lexer = self.create_lexer()
+
+        self.assertTrue(lexer.lexer.lexoptimize)
+        self.assertEqual('FILE_GLOB', lexer.analyze("file(GLOB")[0].type)
+
+    def test_should_rebuild_tables_when_rule_set_changes(self):
+        self.create_lexer()
+        self.tables_file.write_text(self.tables_file.read_text().replace(Lexer.fingerprint(), 'outdated'))
+
+        self.assertFalse(self.create_lexer().lexer.lexoptimize)
+        self.assertIn(Lexer.fingerprint(), self.tables_file.read_text())
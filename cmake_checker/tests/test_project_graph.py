@@ -0,0 +1,70 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from cmake_checker.components.project_graph import FileSummary, ProjectGraph
+from cmake_checker.components.violations import Violations
+
+
+class TestProjectGraph(TestCase):
+    FILES = {
+        'CMakeLists.txt': 'function(configure)\n  include(Helpers)\nendfunction()\n'
+                          'include(cmake/top.cmake)\nadd_subdirectory(sub)\n',
+        'cmake/Helpers.cmake': 'include(${CMAKE_CURRENT_LIST_DIR}/nested.cmake)\n',
+        'cmake/nested.cmake': '',
+        'cmake/top.cmake': '',
+        'sub/CMakeLists.txt': '',
+    }
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        for name, content in self.FILES.items():
+            self.write(name, content)
+        self.files = [self.root / name for name in sorted(self.FILES)]
+        super(TestProjectGraph, self).setUp()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super(TestProjectGraph, self).tearDown()
+
+    def write(self, name: str, content: str) -> None:
+        (self.root / name).parent.mkdir(parents=True, exist_ok=True)
+        (self.root / name).write_text(content)
+
+    def scopes(self, graph: ProjectGraph) -> list:
+        return sorted(str(file.relative_to(self.root)) for file in self.files if graph.is_in_function_scope(file))
+
+    def test_should_summarize_include_and_add_subdirectory_outside_of_comments(self):
+        content = b'#[[\ninclude(a.cmake)\n]]\nFunction(f)\n  include("b c.cmake" OPTIONAL)\nendfunction()\n' \
+                  b'# add_subdirectory(x)\nadd_subdirectory(src bin)\ninclude(d)\n'
+
+        self.assertEqual(FileSummary((('b c.cmake', True), ('d', False)), ('src',)), ProjectGraph.summarize(content))
+
+    def test_files_included_only_from_functions_should_be_in_function_scope(self):
+        graph = ProjectGraph()
+        graph.update(self.files)
+
+        self.assertEqual(['cmake/Helpers.cmake', 'cmake/nested.cmake'], self.scopes(graph))
+
+    def test_should_drop_parent_scope_violations_only_in_function_scope(self):
+        violations = Violations.from_list([('PARENT_SCOPE', 1), ('FILE_GLOB', 2)], 'set(x 1 PARENT_SCOPE)\n')
+        files_with_info = [(file, violations) for file in self.files]
+
+        results = dict(ProjectGraph().select_violations(files_with_info))
+
+        self.assertEqual([('FILE_GLOB', 2)], results[self.root / 'cmake/nested.cmake'])
+        self.assertEqual(violations, results[self.root / 'cmake/top.cmake'])
+
+    def test_edited_file_should_affect_only_files_included_from_it(self):
+        graph = ProjectGraph()
+        graph.update(self.files)
+
+        self.write('cmake/top.cmake', 'set(x 1)\n')
+        self.assertEqual(set(), graph.update(self.files))
+
+        self.write('cmake/top.cmake', 'include(Helpers)\n')
+        affected = graph.update(self.files)
+
+        self.assertEqual({str(self.root / 'cmake/Helpers.cmake'), str(self.root / 'cmake/nested.cmake')}, affected)
+        self.assertEqual([], self.scopes(graph))
@@ -0,0 +1,94 @@
+import io
+import json
+from unittest import TestCase
+from pathlib import Path
+
+from cmake_checker.components.reporter import ConsoleReporter, JUnitReporter, NDJSONReporter, SarifReporter
+from cmake_checker.components.violations import Violations
+
+
+class TestConsoleReporter(TestCase):
+    PATH = Path('cmake_checker/tests/integration_tests')
+
+    def test_should_write_file_results_before_next_file_is_verified(self):
+        output = io.StringIO()
+
+        def files_with_info():
+            yield self.PATH / 'cmake-files-dir/CMakeLists.txt', Violations.from_list([('COMPILE_FLAGS', 1)],
+                                                                                     'CMAKE_CXX_FLAGS\n')
+            self.assertIn("COMPILE_FLAGS> CMAKE_CXX_FLAGS\n", output.getvalue())
+            yield self.PATH / 'empty_file/CMakeLists.txt', Violations()
+
+        ConsoleReporter(files_with_info()).write_report(output)
+
+        self.assertTrue(output.getvalue().endswith("\nScanned 2 file(s). Found 1 issues.\n"))
+
+    def test_should_not_read_scanned_files_again(self):
+        output = io.StringIO()
+        files_with_info = [(Path('not_existing/CMakeLists.txt'), Violations.from_list([('FILE_GLOB', 2)],
+                                                                                      '\nfile(GLOB x)'))]
+
+        ConsoleReporter(files_with_info).write_report(output)
+
+        self.assertIn("\n>>>not_existing/CMakeLists.txt<<<\nline:    2            FILE_GLOB> file(GLOB x)\n",
+                      output.getvalue())
+
+
+class TestJUnitReporter(TestCase):
+    def test_should_not_open_files_without_violations(self):
+        files_with_info = [(Path('not_existing/CMakeLists.txt'), Violations())]
+
+        report = JUnitReporter(files_with_info).generate_report()
+
+        self.assertIn('<testsuite disabled="0" errors="0" failures="0" name="not_existing/CMakeLists.txt" '
+                      'skipped="0" tests="1" time="0">\n\t\t<testcase name="No violations found"/>', report)
+
+    def test_should_escape_source_lines_in_failure_messages(self):
+        files_with_info = [(Path('a&b/CMakeLists.txt'), Violations.from_list([('FILE_GLOB', 1)],
+                                                                             'file(GLOB "<x>"\x0c)\n'))]
+
+        report = JUnitReporter(files_with_info).generate_report()
+
+        self.assertIn('name="a&amp;b/CMakeLists.txt"', report)
+        self.assertIn('FILE_GLOB&gt; file(GLOB &quot;&lt;x&gt;&quot;)\n" type="failure"/>', report)
+        self.assertTrue(report.startswith('<?xml version="1.0" ?>\n<testsuites disabled="0" errors="0" '
+                                          'failures="1" tests="1" time="0.0">\n'))
+
+
+class TestNDJSONReporter(TestCase):
+    def test_should_write_one_violation_per_line_as_files_are_verified(self):
+        output = io.StringIO()
+
+        def files_with_info():
+            yield Path('a/CMakeLists.txt'), Violations.from_list([('FILE_GLOB', 1), ('ADD_DEFINITIONS', 2)],
+                                                                 'file(GLOB x)\r\nadd_definitions(-DX)\n')
+            self.assertEqual(2, output.getvalue().count('\n'))
+            yield Path('b/CMakeLists.txt'), Violations()
+
+        NDJSONReporter(files_with_info()).write_report(output)
+
+        self.assertEqual([{'file': 'a/CMakeLists.txt', 'line': 1, 'rule': 'FILE_GLOB', 'source': 'file(GLOB x)'},
+                          {'file': 'a/CMakeLists.txt', 'line': 2, 'rule': 'ADD_DEFINITIONS',
+                           'source': 'add_definitions(-DX)'}],
+                         [json.loads(line) for line in output.getvalue().splitlines()])
+
+
+class TestSarifReporter(TestCase):
+    def test_should_write_results_with_source_snippets(self):
+        files_with_info = [(Path('a b/CMakeLists.txt'), Violations.from_list([('FILE_GLOB', 2)], '\nfile(GLOB x)\n')),
+                           (Path('c/CMakeLists.txt'), Violations())]
+
+        report = json.loads(SarifReporter(files_with_info).generate_report())
+
+        self.assertEqual('2.1.0', report['version'])
+        self.assertIn({'id': 'FILE_GLOB'}, report['runs'][0]['tool']['driver']['rules'])
+        self.assertEqual([{'ruleId': 'FILE_GLOB', 'level': 'error', 'message': {'text': 'FILE_GLOB'},
+                           'locations': [{'physicalLocation': {
+                               'artifactLocation': {'uri': 'a%20b/CMakeLists.txt'},
+                               'region': {'startLine': 2, 'snippet': {'text': 'file(GLOB x)\n'}}}}]}],
+                         report['runs'][0]['results'])
+
+    def test_should_write_valid_report_without_violations(self):
+        report = json.loads(SarifReporter([]).generate_report())
+
+        self.assertEqual([], report['runs'][0]['results'])
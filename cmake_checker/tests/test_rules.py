@@ -0,0 +1,46 @@
+import io
+from unittest import TestCase
+
+from cmake_checker.components.lexer import Lexer
+from cmake_checker.components.rules import RULE_NAMES, Prefilter, RulesConfigError, load_rules_config, \
+    parse_rule_names, select_rules
+
+
+class TestRules(TestCase):
+    CONTENT = "file(GLOB x)\nstring(APPEND CMAKE_CXX_FLAGS -O3)\nfunction(f)\nset(x 1 PARENT_SCOPE)\nendfunction(f)\n"
+
+    def test_every_lexer_token_should_be_described_by_rule(self):
+        self.assertEqual(sorted(Lexer.tokens), sorted(RULE_NAMES))
+
+    def test_should_reject_unknown_rule_names(self):
+        self.assertEqual(['FILE_GLOB', 'PARENT_SCOPE'], parse_rule_names(' FILE_GLOB,PARENT_SCOPE, '))
+        with self.assertRaises(RulesConfigError):
+            parse_rule_names('FILE_GLOB,GLOB')
+
+    def test_disabled_rules_should_override_enabled_ones(self):
+        self.assertEqual(frozenset(['FILE_GLOB']), select_rules(['FILE_GLOB', 'ENDFUNCTION'], ['ENDFUNCTION']))
+        self.assertEqual(len(RULE_NAMES) - 1, len(select_rules(disabled=['ENDFUNCTION'])))
+
+    def test_should_load_rules_from_config_file(self):
+        config = io.StringIO("[rules]\nenable = FILE_GLOB, ENDFUNCTION\ndisable = ENDFUNCTION\n")
+
+        self.assertEqual((['FILE_GLOB', 'ENDFUNCTION'], ['ENDFUNCTION']), load_rules_config(config))
+        self.assertEqual((None, []), load_rules_config(io.StringIO("[other]\nx = 1\n")))
+        with self.assertRaises(RulesConfigError):
+            load_rules_config(io.StringIO("enable = FILE_GLOB\n"))
+
+    def test_lexer_with_selected_rules_should_find_only_their_violations(self):
+        tokens = Lexer(['COMPILE_FLAGS', 'ENDFUNCTION']).analyze(self.CONTENT)
+
+        self.assertEqual([('COMPILE_FLAGS', 2), ('ENDFUNCTION', 5)], [(token.type, token.lineno) for token in tokens])
+        self.assertFalse(Lexer([]).analyze(self.CONTENT))
+
+    def test_prefilter_should_skip_content_without_rule_keywords(self):
+        prefilter = Prefilter(['FILE_GLOB', 'COMPILE_FLAGS'], 'utf-8')
+
+        self.assertTrue(prefilter.may_match(b'set(CMAKE_C_FLAGS x)'))
+        self.assertFalse(prefilter.may_match(b'add_compile_options(-Wall)'))
+        self.assertTrue(prefilter.may_match('file(GLOB x)'))
+        self.assertFalse(prefilter.may_match('add_compile_options(-Wall)'))
+        self.assertFalse(Prefilter([], 'utf-8').may_match(b'file(GLOB x)'))
+        self.assertTrue(Prefilter(['FILE_GLOB'], 'utf-16').may_match(b''))
@@ -0,0 +1,48 @@
+import io
+from pathlib import Path
+from unittest import TestCase
+
+from cmake_checker.components.reporter import PartialReporter
+from cmake_checker.components.shards import PartialResults, Shard, ShardError
+from cmake_checker.components.violations import Violations
+
+
+class TestShard(TestCase):
+    FILES = [Path('dir_%d/CMakeLists.txt' % index) for index in range(200)]
+
+    def test_should_parse_shard_and_reject_invalid_ones(self):
+        self.assertEqual('2/5', str(Shard.parse('2/5')))
+        for text in ('0/5', '6/5', '1/0', '1', 'a/b'):
+            with self.assertRaises(ShardError):
+                Shard.parse(text)
+
+    def test_every_file_should_belong_to_exactly_one_shard(self):
+        shards = [Shard(index, 3) for index in range(1, 4)]
+        selected = [list(shard.select_files(self.FILES)) for shard in shards]
+
+        self.assertEqual(sorted(self.FILES), sorted(sum(selected, [])))
+        self.assertTrue(all(selected))
+        self.assertEqual(selected, [list(Shard(index, 3).select_files(self.FILES)) for index in range(1, 4)])
+
+    def test_merged_partial_results_should_keep_order_and_source_lines(self):
+        files_with_info = [(file, Violations.from_list([('FILE_GLOB', 2)], '\nfile(GLOB x)\r\n') if index % 7 else
+                            Violations()) for index, file in enumerate(self.FILES)]
+        violations = dict(files_with_info)
+        partials = []
+        for index in (2, 1):
+            shard = Shard(index, 2)
+            shard_results = [(file, violations[file]) for file in shard.select_files(self.FILES)]
+            partials.append(io.StringIO(PartialReporter(shard_results, shard).generate_report()))
+
+        merged = list(PartialResults.merge(partials).files_with_info())
+
+        self.assertEqual(files_with_info, merged)
+        self.assertEqual('file(GLOB x)\r\n', merged[1][1].source_line(2))
+
+    def test_should_report_missing_and_repeated_shards(self):
+        partial = PartialReporter([], Shard(1, 3)).generate_report()
+
+        with self.assertRaisesRegex(ShardError, 'shard\\(s\\): 2/3, 3/3'):
+            PartialResults.merge([io.StringIO(partial)])
+        with self.assertRaisesRegex(ShardError, 'more than once'):
+            PartialResults.merge([io.StringIO(partial), io.StringIO(partial)])
@@ -0,0 +1,55 @@
+import io
+import json
+from unittest import TestCase
+from pathlib import Path
+
+from cmake_checker.components.statistics import Statistics, FileMeasurement
+from cmake_checker.components.verifier import Verifier
+
+
+class TestStatistics(TestCase):
+    PATH = Path('cmake_checker/tests/integration_tests')
+
+    def test_nested_phases_should_be_measured_exclusively(self):
+        statistics = Statistics()
+
+        with statistics.measure('outer'):
+            with statistics.measure('inner'):
+                sum(range(100000))
+
+        phases = statistics.to_dict()['phases']
+        self.assertEqual({'inner', 'outer'}, set(phases))
+        self.assertLess(phases['outer']['wall_time'], phases['inner']['wall_time'])
+
+    def test_timed_should_pass_through_all_items(self):
+        statistics = Statistics()
+
+        self.assertEqual([1, 2, 3], list(statistics.timed('phase', [1, 2, 3])))
+        self.assertIn('phase', statistics.to_dict()['phases'])
+
+    def test_should_keep_only_slowest_files(self):
+        statistics = Statistics(slowest_files_number=2)
+
+        for index, seconds in enumerate([0.3, 0.1, 0.5, 0.2]):
+            statistics.record_file(Path('file%d' % index), FileMeasurement(10, 0.0, 0.0, seconds, seconds, index))
+
+        result = statistics.to_dict()
+        self.assertEqual(4, result['files'])
+        self.assertEqual(40, result['bytes'])
+        self.assertEqual(['file2', 'file0'], [entry['file'] for entry in result['slowest_files']])
+        self.assertEqual([2, 0], [entry['violations'] for entry in result['slowest_files']])
+
+    def test_verifier_should_record_every_checked_file(self):
+        files = [self.PATH / 'empty_file/CMakeLists.txt', self.PATH / 'dir_with_file_glob_issue/CMakeLists.txt'] * 20
+
+        for jobs in (1, 2):
+            statistics = Statistics()
+            list(Verifier(jobs, statistics=statistics).check_path(files))
+            output = io.StringIO()
+            statistics.write_json(output)
+
+            result = json.loads(output.getvalue())
+            self.assertEqual(40, result['files'])
+            self.assertEqual(sum(file.stat().st_size for file in files), result['bytes'])
+            self.assertEqual({'file_io', 'lexing'}, set(result['file_phases']))
+            self.assertEqual(3, max(entry['violations'] for entry in result['slowest_files']))
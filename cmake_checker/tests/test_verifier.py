@@ -0,0 +1,79 @@
+import itertools
+import multiprocessing
+import tempfile
+from unittest import TestCase, mock
+from pathlib import Path
+
+from cmake_checker.components.verifier import Verifier
+
+
+class TestVerifier(TestCase):
+    PATH = Path('cmake_checker/tests/integration_tests')
+
+    def test_should_yield_results_before_all_files_are_provided(self):
+        files = itertools.repeat(self.PATH / 'dir_with_file_glob_issue/CMakeLists.txt')
+
+        file, violations = next(Verifier().check_path(files))
+
+        self.assertEqual(self.PATH / 'dir_with_file_glob_issue/CMakeLists.txt', file)
+        self.assertEqual([('FILE_GLOB', 2), ('FILE_GLOB', 3), ('ADD_COMPILE_OPTIONS', 6)], violations)
+
+    def test_parallel_results_should_keep_order_of_provided_files(self):
+        files = [self.PATH / 'empty_file/CMakeLists.txt',
+                 self.PATH / 'dir_with_file_glob_issue/CMakeLists.txt',
+                 self.PATH / 'cmake-files-dir/CMakeLists.txt'] * 20
+
+        self.assertEqual(list(Verifier().check_path(files)), list(Verifier(jobs=3).check_path(files)))
+
+    def test_memory_mapped_files_should_give_the_same_results_as_read_ones(self):
+        class MemoryMappingVerifier(Verifier):
+            MMAP_THRESHOLD = 1
+            MMAP_CHUNK_SIZE = 5
+
+        content = (self.PATH / 'dir_with_file_glob_issue/CMakeLists.txt').read_bytes().replace(b'\n', b'\r\n')
+        with tempfile.TemporaryDirectory() as directory:
+            file = Path(directory) / 'CMakeLists.txt'
+            file.write_bytes(content)
+
+            expected = Verifier().check_file(file)
+            violations = MemoryMappingVerifier().check_file(file)
+
+        self.assertEqual(expected, violations)
+        self.assertEqual(expected.source_lines, violations.source_lines)
+
+    def test_should_stop_lexing_file_at_max_violations(self):
+        files = [self.PATH / 'dir_with_file_glob_issue/CMakeLists.txt'] * 40
+
+        for verifier in (Verifier(max_violations=2), Verifier(jobs=2, max_violations=2)):
+            for _, violations in verifier.check_path(files):
+                self.assertEqual([('FILE_GLOB', 2), ('FILE_GLOB', 3)], violations)
+
+    def test_open_pool_should_be_reused_by_subsequent_checks(self):
+        files = [self.PATH / 'empty_file/CMakeLists.txt', self.PATH / 'dir_with_file_glob_issue/CMakeLists.txt'] * 20
+        verifier = Verifier(jobs=2)
+        verifier.open_pool()
+        pool = verifier.pool
+        try:
+            first = list(verifier.check_path(files))
+            second = list(verifier.check_path(files))
+            self.assertIs(pool, verifier.pool)
+        finally:
+            verifier.close_pool()
+
+        self.assertEqual(list(Verifier().check_path(files)), first)
+        self.assertEqual(first, second)
+        self.assertIsNone(verifier.pool)
+
+    def test_should_start_only_as_many_processes_as_there_are_chunks_of_files(self):
+        file = self.PATH / 'dir_with_file_glob_issue/CMakeLists.txt'
+
+        for number_of_files, processes in ((2, None), (Verifier.CHUNK_SIZE, None), (Verifier.CHUNK_SIZE * 3, 3),
+                                           (Verifier.CHUNK_SIZE * 100, 4)):
+            with mock.patch('multiprocessing.Pool', wraps=multiprocessing.Pool) as pool:
+                results = list(Verifier(jobs=4).check_path([file] * number_of_files))
+
+            self.assertEqual(number_of_files, len(results))
+            if processes is None:
+                pool.assert_not_called()
+            else:
+                self.assertEqual(processes, pool.call_args[0][0])
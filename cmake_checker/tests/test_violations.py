@@ -0,0 +1,55 @@
+import collections
+from unittest import TestCase
+
+from cmake_checker.components.violations import Violation, ViolationCounter, Violations, lines_with_numbers
+
+
+class TestViolations(TestCase):
+    def test_should_provide_source_lines_the_same_way_as_reading_file_line_by_line(self):
+        data = "first\n\nthird\nlast without newline"
+
+        lines = lines_with_numbers(data, [4, 2, 1, 4, 7])
+
+        self.assertEqual({1: "first\n", 2: "\n", 4: "last without newline"}, lines)
+
+    def test_should_behave_like_list_of_violation_tuples(self):
+        violations = Violations.from_list([('FILE_GLOB', 1), ('PARENT_SCOPE', 3)], "file(GLOB\n\nset(A PARENT_SCOPE)\n")
+
+        self.assertEqual([('FILE_GLOB', 1), ('PARENT_SCOPE', 3)], violations)
+        self.assertEqual(2, len(violations))
+        self.assertEqual("set(A PARENT_SCOPE)\n", violations.source_line(3))
+        self.assertEqual('', violations.source_line(2))
+        self.assertFalse(Violations())
+
+    def test_should_find_source_lines_split_between_chunks(self):
+        chunks = ["file(GLOB\n", "\n", "set(A PARENT_SCOPE)\nlast"]
+
+        violations = Violations.from_list_in_chunks([('FILE_GLOB', 1), ('PARENT_SCOPE', 3), ('FILE_GLOB', 4)], chunks)
+
+        self.assertEqual({1: "file(GLOB\n", 3: "set(A PARENT_SCOPE)\n", 4: "last"}, violations.source_lines)
+
+    def test_should_store_violations_as_compact_columns(self):
+        violations = Violations.from_list([('FILE_GLOB', 1), ('SOME_NEW_RULE', 70000)], "")
+
+        self.assertEqual('H', violations.rule_ids.typecode)
+        self.assertEqual('I', violations.line_numbers.typecode)
+        self.assertEqual([Violation('FILE_GLOB', 1), Violation('SOME_NEW_RULE', 70000)], list(violations))
+        self.assertEqual('SOME_NEW_RULE', next(iter(violations.select(lambda _, line: line > 1))).type)
+
+    def test_should_stop_consuming_tokens_at_limit(self):
+        Token = collections.namedtuple('Token', ['type', 'lineno', 'lexpos'])
+        tokens = iter([Token('FILE_GLOB', 1, 0), Token('PARENT_SCOPE', 2, 10), Token('FILE_GLOB', 3, 30)])
+
+        violations = Violations.from_chunks([("file(GLOB\nset(A PARENT_SCOPE)\nfile(GLOB", tokens)], limit=2)
+
+        self.assertEqual([('FILE_GLOB', 1), ('PARENT_SCOPE', 2)], violations)
+        self.assertEqual([Token('FILE_GLOB', 3, 30)], list(tokens))
+
+    def test_should_count_violations_without_keeping_them(self):
+        counter = ViolationCounter()
+        files_with_info = [('a.cmake', Violations.from_list([('FILE_GLOB', 1), ('FILE_GLOB', 2)], '')),
+                           ('b.cmake', Violations()),
+                           ('c.cmake', Violations.from_list([('PARENT_SCOPE', 3)], ''))]
+
+        self.assertEqual(files_with_info, list(counter.counted(files_with_info)))
+        self.assertEqual(3, counter.count)
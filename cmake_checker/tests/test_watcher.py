@@ -0,0 +1,63 @@
+import tempfile
+import threading
+from unittest import TestCase, skipUnless
+from pathlib import Path
+
+from cmake_checker.components.watcher import InotifyWatcher, PollingWatcher
+
+
+def inotify_available() -> bool:
+    try:
+        InotifyWatcher([tempfile.gettempdir()], lambda path, structural: None).stop()
+    except (OSError, AttributeError, TypeError):
+        return False
+    return True
+
+
+class TestWatcher(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        (self.root / 'sub').mkdir()
+        (self.root / 'sub/CMakeLists.txt').write_text('project(a)\n')
+        self.changes = []
+        self.changed = threading.Event()
+        super(TestWatcher, self).setUp()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super(TestWatcher, self).tearDown()
+
+    def on_change(self, path: str, structural: bool) -> None:
+        self.changes.append((path, structural))
+        self.changed.set()
+
+    def test_polling_watcher_should_report_modified_and_created_files(self):
+        watcher = PollingWatcher([str(self.root)], self.on_change)
+        (self.root / 'sub/CMakeLists.txt').write_text('project(changed)\n')
+        (self.root / 'sub/new.cmake').write_text('')
+
+        watcher.poll()
+
+        self.assertEqual([(str(self.root / 'sub/CMakeLists.txt'), False), (str(self.root / 'sub/new.cmake'), True)],
+                         self.changes)
+
+    @skipUnless(inotify_available(), 'inotify is not available')
+    def test_inotify_watcher_should_report_files_created_in_new_directories(self):
+        watcher = InotifyWatcher([str(self.root)], self.on_change)
+        watcher.start()
+        try:
+            (self.root / 'sub/new').mkdir()
+            self.assertTrue(self.changed.wait(5))
+            (self.root / 'sub/new/new.cmake').write_text('')
+            for _ in range(50):
+                if (str(self.root / 'sub/new/new.cmake'), True) in self.changes:
+                    break
+                self.changed.clear()
+                self.changed.wait(0.1)
+        finally:
+            watcher.stop()
+            watcher.thread.join()
+
+        self.assertIn((str(self.root / 'sub/new'), True), self.changes)
+        self.assertIn((str(self.root / 'sub/new/new.cmake'), True), self.changes)
@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+from pathspec import PathSpec
+
+from cmake_checker.components.whitelist import WhitelistMatcher
+
+
+class TestWhitelistMatcher(TestCase):
+    def assertMatchesLikePathSpec(self, whitelist: list, files: list) -> None:
+        spec = PathSpec.from_lines('gitwildmatch', whitelist)
+        matcher = WhitelistMatcher(whitelist)
+        for file in files:
+            self.assertEqual(spec.match_file(file), matcher.match_file(file), (whitelist, file))
+
+    def test_last_matching_pattern_should_decide(self):
+        files = ['build/CMakeLists.txt', 'build/keep.cmake', 'src/build/keep.cmake', 'src/a.cmake', './build/x.cmake']
+
+        self.assertMatchesLikePathSpec(['build/', '!keep.cmake'], files)
+        self.assertMatchesLikePathSpec(['!keep.cmake', 'build/'], files)
+        self.assertMatchesLikePathSpec(['*.cmake', '!/build/', 'src/**'], files)
+
+    def test_should_ignore_whole_directories_only_without_negated_patterns(self):
+        self.assertTrue(WhitelistMatcher(['third_party/']).match_directory('src/third_party'))
+        self.assertTrue(WhitelistMatcher(['/src']).match_directory('src/third_party'))
+        self.assertFalse(WhitelistMatcher(['third_party/*.cmake']).match_directory('third_party'))
+        self.assertFalse(WhitelistMatcher(['third_party/', '!third_party/a']).match_directory('third_party'))
+
+    def test_should_match_files_in_ignored_directories(self):
+        matcher = WhitelistMatcher(['**/generated'])
+
+        self.assertTrue(matcher.match_file('/tmp/generated/a/b/CMakeLists.txt'))
+        self.assertTrue(matcher.match_file('/tmp/generated/a/c/CMakeLists.txt'))
+        self.assertFalse(matcher.match_file('/tmp/generated.cmake'))
+        self.assertIn('/tmp/generated/a', matcher.directory_results)
@@ -1,11 +1,19 @@
+import re
+
 from setuptools import find_packages, setup
 
+
+def read_version() -> str:
+    with open('cmake_checker/__init__.py') as init_file:
+        return re.search(r"__version__ = '(.+)'", init_file.read()).group(1)
+
+
 setup(
     name='cmake_checker',
-    version='0.1.3',
+    version=read_version(),
     author='Maciej Patro',
     author_email='maciejpatro@gmail.com',
-    packages=find_packages(exclude=["tests", "*.tests", "*.tests.*", "tests.*"]),
+    packages=find_packages(exclude=["tests", "*.tests", "*.tests.*", "tests.*", "benchmarks", "benchmarks.*"]),
     url='https://github.com/MaciejPatro/cmake-checker',
     license='LICENSE',
     description='cmake-checker is a tool to search for violations to \'modern\' cmake rules.',
@@ -14,7 +22,6 @@ setup(
     python_requires='>=3.5.0',
     install_requires=[
         "ply == 3.11",
-        "junit-xml == 1.8",
         "pathspec == 0.5.9",
     ],
     include_package_data=True,